@@ -5,26 +5,25 @@ This module provides high-performance Rust implementations of core LangGraph com
 that can be used as drop-in replacements for the original Python implementations.
 """
 
+import importlib
 import os
-import sys
-from typing import Any, Optional
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-# Try to import the Rust extension module
-try:
-    from . import fast_langgraph
-
-    _rust_available = True
-except ImportError:
-    _rust_available = False
-    fast_langgraph = None
-
-# Re-export main classes for direct usage
-if _rust_available:
-    # Import Python-friendly cached decorator
+if TYPE_CHECKING:
+    from . import accelerator, profiler, shim
+    from .accelerator import (
+        AcceleratedPregelLoop,
+        accelerate_apply_writes,
+        accelerate_triggers,
+        is_accelerator_available,
+        patch_algo,
+        unpatch_algo,
+    )
     from .cache_decorator import cached
     from .fast_langgraph import (
         BaseChannel,
-        # Hybrid acceleration classes
         ChannelManager,
         Checkpoint,
         FastChannelUpdater,
@@ -32,13 +31,9 @@ if _rust_available:
         LastValue,
         Pregel,
         PregelAccelerator,
-        # Fast checkpoint
         RustCheckpointer,
-        # Function caching (low-level)
         RustFunctionCache,
-        # Fast channel types
         RustLastValue,
-        # LLM cache
         RustLLMCache,
         RustSQLiteCheckpointer,
         RustSQLiteLLMCache,
@@ -48,65 +43,163 @@ if _rust_available:
         deep_merge_dicts,
         get_state_diff,
         langgraph_state_update,
-        # State merge operations
         merge_dicts,
         merge_lists,
         merge_many_dicts,
         states_equal,
         update_dict_inplace,
     )
+    from .fast_langgraph import BaseChannel as Channel
+    from .fast_langgraph import GraphExecutor as PregelExecutor
+    from .fast_langgraph import LastValue as LastValueChannel
+    from .profiler import (
+        GraphProfiler,
+        NodeProfiler,
+        PerformanceRecommendations,
+        create_node_profiler,
+        create_profiler,
+        profile_function,
+    )
 
-    # Legacy alias
-    PregelExecutor = GraphExecutor
-    LastValueChannel = LastValue
-else:
-    # Fallback stubs if Rust extension is not available
-    class BaseChannel:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError("Rust extension not available")
-
-    class LastValue:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError("Rust extension not available")
-
-    class Checkpoint:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError("Rust extension not available")
-
-    class Pregel:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError("Rust extension not available")
-
-    class GraphExecutor:  # type: ignore[no-redef]
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            raise ImportError("Rust extension not available")
-
-    PregelExecutor = GraphExecutor
-    LastValueChannel = LastValue
-
-# Import shim module
-# Import accelerator module
-# Import profiler module
-from . import accelerator, profiler, shim
-from .accelerator import (
-    AcceleratedPregelLoop,
-    accelerate_apply_writes,
-    accelerate_triggers,
-    is_accelerator_available,
-    patch_algo,
-    unpatch_algo,
+# Names provided by the compiled Rust extension. These are resolved lazily on
+# first attribute access (PEP 562), so importing the package does not load the
+# extension until one of them is actually used.
+_EXTENSION_EXPORTS = frozenset(
+    {
+        "BaseChannel",
+        # Hybrid acceleration classes
+        "ChannelManager",
+        "Checkpoint",
+        "FastChannelUpdater",
+        "GraphExecutor",
+        "LastValue",
+        "Pregel",
+        "PregelAccelerator",
+        # Fast checkpoint
+        "RustCheckpointer",
+        # Function caching (low-level)
+        "RustFunctionCache",
+        # Fast channel types
+        "RustLastValue",
+        # LLM cache
+        "RustLLMCache",
+        "RustSQLiteCheckpointer",
+        "RustSQLiteLLMCache",
+        "RustTTLCache",
+        "TaskScheduler",
+        "apply_writes_batch",
+        "deep_merge_dicts",
+        "get_state_diff",
+        "langgraph_state_update",
+        # State merge operations
+        "merge_dicts",
+        "merge_lists",
+        "merge_many_dicts",
+        "states_equal",
+        "update_dict_inplace",
+    }
 )
-from .profiler import (
-    GraphProfiler,
-    NodeProfiler,
-    PerformanceRecommendations,
-    create_node_profiler,
-    create_profiler,
-    profile_function,
+
+# Legacy aliases
+_ALIASES: Dict[str, str] = {
+    "PregelExecutor": "GraphExecutor",
+    "LastValueChannel": "LastValue",
+    "Channel": "BaseChannel",
+}
+
+# Pure-Python submodules and the names re-exported from them
+_SUBMODULES = frozenset({"accelerator", "profiler", "shim"})
+_SUBMODULE_EXPORTS: Dict[str, str] = {
+    # Python-friendly cached decorator
+    "cached": "cache_decorator",
+    # Accelerator module
+    "AcceleratedPregelLoop": "accelerator",
+    "accelerate_apply_writes": "accelerator",
+    "accelerate_triggers": "accelerator",
+    "is_accelerator_available": "accelerator",
+    "patch_algo": "accelerator",
+    "unpatch_algo": "accelerator",
+    # Profiler module
+    "GraphProfiler": "profiler",
+    "NodeProfiler": "profiler",
+    "PerformanceRecommendations": "profiler",
+    "create_node_profiler": "profiler",
+    "create_profiler": "profiler",
+    "profile_function": "profiler",
+}
+
+
+# Core classes that resolve to placeholders from ._fallback if the Rust
+# extension is not available
+_FALLBACK_STUBS = frozenset(
+    {"BaseChannel", "LastValue", "Checkpoint", "Pregel", "GraphExecutor"}
 )
 
+_extension: Optional[ModuleType] = None
+_rust_available: Optional[bool] = None
+_extension_lock = threading.RLock()
+
+
+def _load_extension() -> Optional[ModuleType]:
+    """Import the Rust extension module on first use and cache the result."""
+    global _extension, _rust_available
+
+    if _rust_available is None:
+        # Serialize the first load so concurrent first uses from several
+        # threads do not each attempt (and, on failure, retry) the import.
+        # Reentrant because the import can touch package attributes again.
+        with _extension_lock:
+            if _rust_available is None:
+                try:
+                    # Not "from . import ...": that probes the package attribute
+                    # first, which would re-enter __getattr__
+                    _extension = importlib.import_module(f"{__name__}.fast_langgraph")
+                    _rust_available = True
+                except ImportError:
+                    _rust_available = False
+    return _extension
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name in _ALIASES:
+        value = __getattr__(_ALIASES[name])
+    elif name in _EXTENSION_EXPORTS:
+        extension = _load_extension()
+        if extension is not None:
+            value = getattr(extension, name)
+        elif name in _FALLBACK_STUBS:
+            value = getattr(importlib.import_module(f"{__name__}._fallback"), name)
+        else:
+            raise AttributeError(
+                f"{name!r} requires the fast_langgraph Rust extension, "
+                "which is not available"
+            )
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _SUBMODULE_EXPORTS:
+        try:
+            module = importlib.import_module(f"{__name__}.{_SUBMODULE_EXPORTS[name]}")
+        except ImportError as e:
+            raise AttributeError(f"{name!r} is not available: {e}") from e
+        value = getattr(module, name)
+    elif name == "fast_langgraph":
+        value = _load_extension()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache in module globals so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "BaseChannel",
+    "Channel",
     "LastValue",
     "LastValueChannel",
     "Checkpoint",
@@ -163,17 +256,16 @@ __all__ = [
 
 def is_rust_available() -> bool:
     """Check if the Rust extension is available."""
-    return _rust_available
+    return _load_extension() is not None
 
 
-# Auto-patch if environment variable is set (support both old and new env var names)
+# Auto-patch if environment variable is set (support both old and new env var names).
+# Patching is deferred until LangGraph itself is imported, so enabling it does
+# not make `import fast_langgraph` import langgraph.
 if (
     os.environ.get("FAST_LANGGRAPH_AUTO_PATCH") == "1"
     or os.environ.get("LANGGRAPH_RS_AUTO_PATCH") == "1"
 ):
-    try:
-        shim.patch_langgraph()
-    except Exception as e:
-        import warnings
+    from . import autopatch as _autopatch
 
-        warnings.warn(f"Failed to auto-patch langgraph: {e}", RuntimeWarning)
+    _autopatch.install()
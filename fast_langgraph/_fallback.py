@@ -0,0 +1,34 @@
+"""
+Placeholder classes used in place of the core classes if the Rust extension
+is not available.
+
+Kept out of fast_langgraph/__init__.py so this module is only imported when
+the extension is missing.
+"""
+
+from typing import Any
+
+
+class _UnavailableStub:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        raise ImportError("Rust extension not available")
+
+
+class BaseChannel(_UnavailableStub):
+    pass
+
+
+class LastValue(_UnavailableStub):
+    pass
+
+
+class Checkpoint(_UnavailableStub):
+    pass
+
+
+class Pregel(_UnavailableStub):
+    pass
+
+
+class GraphExecutor(_UnavailableStub):
+    pass
@@ -0,0 +1,65 @@
+"""
+pytest plugin used by scripts/test_compatibility.py to run LangGraph's own
+test suite with the Fast LangGraph shim applied.
+
+Loaded through ``PYTEST_PLUGINS=fast_langgraph._pytest_plugin`` while the
+runner swaps LangGraph's top-level conftest for a minimal one. Provides the
+common fixtures LangGraph's tests expect from their conftest.
+"""
+
+import asyncio
+from typing import Any, Iterator
+
+import pytest
+
+
+def pytest_configure(config: Any) -> None:
+    """Apply the Fast LangGraph shim before pytest collects tests"""
+    from .shim import patch_langgraph
+
+    patch_langgraph()
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Create an event loop for async tests"""
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
+
+
+# Checkpointer fixtures - commonly required by LangGraph tests
+@pytest.fixture
+def checkpointer() -> Any:
+    """Basic in-memory checkpointer fixture"""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    return MemorySaver()
+
+
+@pytest.fixture
+def sync_checkpointer() -> Any:
+    """Sync checkpointer fixture"""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    return MemorySaver()
+
+
+@pytest.fixture
+async def async_checkpointer() -> Any:
+    """Async checkpointer fixture"""
+    from langgraph.checkpoint.memory import MemorySaver
+
+    return MemorySaver()
+
+
+# Store fixture for tests that need it
+@pytest.fixture
+def store() -> Any:
+    """Basic store fixture"""
+    try:
+        from langgraph.store.memory import InMemoryStore
+
+        return InMemoryStore()
+    except ImportError:
+        return None
@@ -0,0 +1,129 @@
+"""
+Deferred auto-patching for FAST_LANGGRAPH_AUTO_PATCH=1.
+
+Importing fast_langgraph with auto-patching enabled used to import
+langgraph (and with it langchain-core and pydantic) immediately, even for
+code that never touches LangGraph. Instead, this module installs a
+meta path finder that waits for LangGraph's Pregel algorithm module to be imported
+and applies the patches the moment that module has finished executing.
+
+If LangGraph is already imported, the patches are applied right away.
+"""
+
+import importlib.abc
+import sys
+import warnings
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+# Modules whose import triggers auto-patching (langgraph >= 0.6)
+_TRIGGER_MODULES = ("langgraph.pregel._algo",)
+
+
+class _PostImportLoader(importlib.abc.Loader):
+    """
+    Loader wrapper that calls a hook after the wrapped loader executes a module.
+    """
+
+    def __init__(
+        self, loader: importlib.abc.Loader, hook: Callable[[ModuleType], None]
+    ) -> None:
+        self._loader = loader
+        self._hook = hook
+
+    def create_module(self, spec: ModuleSpec) -> Optional[ModuleType]:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._loader.exec_module(module)
+        self._hook(module)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate everything else (get_source, is_package, ...) to the real loader
+        return getattr(self._loader, name)
+
+
+class PostImportFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that runs a hook once one of the given modules is imported.
+
+    The finder does not locate modules itself: it asks the remaining finders
+    on sys.meta_path for the spec and wraps the loader. It removes itself from
+    sys.meta_path after the first match, so the hook runs at most once.
+    """
+
+    def __init__(
+        self, module_names: Iterable[str], hook: Callable[[ModuleType], None]
+    ) -> None:
+        self.module_names = frozenset(module_names)
+        self._hook = hook
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Optional[ModuleSpec]:
+        if fullname not in self.module_names:
+            return None
+
+        self.remove()
+
+        spec: Optional[ModuleSpec] = None
+        for finder in sys.meta_path:
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+
+        spec.loader = _PostImportLoader(spec.loader, self._hook)
+        return spec
+
+    def install(self) -> None:
+        """Install the finder in front of the default finders."""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def remove(self) -> None:
+        """Remove the finder from sys.meta_path if installed."""
+        try:
+            sys.meta_path.remove(self)
+        except ValueError:
+            pass
+
+
+def _auto_patch(module: Optional[ModuleType] = None) -> None:
+    try:
+        from .shim import patch_langgraph
+
+        patch_langgraph()
+    except Exception as e:
+        warnings.warn(f"Failed to auto-patch langgraph: {e}", RuntimeWarning)
+
+
+def install() -> None:
+    """
+    Arrange for patch_langgraph() to run when LangGraph is imported.
+
+    Patches immediately if LangGraph's algorithm module is already loaded.
+    """
+    if any(name in sys.modules for name in _TRIGGER_MODULES):
+        _auto_patch()
+        return
+
+    if any(
+        isinstance(finder, PostImportFinder)
+        and finder.module_names == frozenset(_TRIGGER_MODULES)
+        for finder in sys.meta_path
+    ):
+        return
+
+    PostImportFinder(_TRIGGER_MODULES, _auto_patch).install()
@@ -9,10 +9,17 @@ instead of creating new ones each time, which saves ~20ms per invocation.
 """
 
 import atexit
+import logging
+import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional, Tuple
 
+_log = logging.getLogger(__name__)
+
+# get_executor_for_config as it was before patch_langchain_executor()
+_original_get_executor: Optional[Any] = None
+
 
 class ExecutorCache:
     """
@@ -149,15 +156,20 @@ def patch_langchain_executor() -> bool:
     Patch LangChain's executor creation to use cached executors.
 
     This is the key optimization that eliminates 20ms overhead per invocation.
+    Calling it again while the patch is applied does nothing.
     """
+    global _original_get_executor
+
+    if _original_get_executor is not None:
+        return True
+
     try:
         from langchain_core.runnables import config as lc_config
 
-        # Store original function
-        _original_get_executor = getattr(lc_config, "get_executor_for_config", None)
+        original_get_executor = getattr(lc_config, "get_executor_for_config", None)
 
-        if _original_get_executor is None:
-            print("⚠ Warning: Could not find get_executor_for_config in langchain_core")
+        if original_get_executor is None:
+            _log.warning("Could not find get_executor_for_config in langchain_core")
             return False
 
         # Create patched version
@@ -173,23 +185,37 @@ def patch_langchain_executor() -> bool:
             # Return cached executor in context manager
             return CachedExecutorContext(max_workers)
 
-        # Apply patch
+        # Store original function and apply patch
+        _original_get_executor = original_get_executor
         lc_config.get_executor_for_config = get_executor_for_config_cached  # type: ignore[assignment]
 
-        print("✓ Patched LangChain executor to use caching")
-        print("  Expected speedup: 2-3x for graph invocations")
+        _log.info(
+            "✓ Patched LangChain executor to use caching "
+            "(expected speedup: 2-3x for graph invocations)"
+        )
         return True
 
     except ImportError:
-        print("⚠ Warning: langchain_core not available, executor caching disabled")
+        _log.warning("langchain_core not available, executor caching disabled")
         return False
     except Exception as e:
-        print(f"✗ Error patching executor: {e}")
+        _log.error("Error patching executor: %s", e)
         return False
 
 
 def unpatch_langchain_executor() -> None:
-    """Restore original LangChain executor creation."""
-    # Implementation would restore the original function
-    # For now, requires restart to unpatch
-    pass
+    """
+    Restore original LangChain executor creation.
+
+    Executors already handed out stay in the cache until
+    shutdown_executor_cache() is called or the process exits.
+    """
+    global _original_get_executor
+
+    if _original_get_executor is None:
+        return
+
+    lc_config = sys.modules.get("langchain_core.runnables.config")
+    if lc_config is not None:
+        lc_config.get_executor_for_config = _original_get_executor  # type: ignore[attr-defined]
+    _original_get_executor = None
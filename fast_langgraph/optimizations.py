@@ -11,8 +11,11 @@ Usage:
     enable_all_optimizations()
 """
 
+import logging
 from typing import Any, Dict
 
+_log = logging.getLogger(__name__)
+
 
 def enable_all_optimizations(verbose: bool = True) -> Dict[str, Any]:
     """
@@ -24,7 +27,7 @@ def enable_all_optimizations(verbose: bool = True) -> Dict[str, Any]:
     - Accelerated apply_writes with FastChannelUpdater
 
     Args:
-        verbose: If True, print status messages
+        verbose: If True, log status messages
 
     Returns:
         Dictionary with optimization status:
@@ -51,7 +54,7 @@ def enable_all_optimizations(verbose: bool = True) -> Dict[str, Any]:
             results["total_enabled"] += 1
     except Exception as e:
         if verbose:
-            print(f"⚠ Warning: Could not enable executor caching: {e}")
+            _log.warning("Could not enable executor caching: %s", e)
 
     # 2. Enable Rust checkpoint (via shim system)
     try:
@@ -62,12 +65,10 @@ def enable_all_optimizations(verbose: bool = True) -> Dict[str, Any]:
         results["rust_checkpoint"] = True
         results["total_enabled"] += 1
         if verbose:
-            print("✓ RustCheckpointer available (use directly or via shim)")
+            _log.info("✓ RustCheckpointer available (use directly or via shim)")
     except ImportError:
         if verbose:
-            print(
-                "⚠ Warning: RustCheckpointer not available (Rust extension not built)"
-            )
+            _log.warning("RustCheckpointer not available (Rust extension not built)")
 
     # 3. Enable accelerated algorithm functions
     try:
@@ -78,11 +79,14 @@ def enable_all_optimizations(verbose: bool = True) -> Dict[str, Any]:
             results["total_enabled"] += 1
     except Exception as e:
         if verbose:
-            print(f"⚠ Warning: Could not enable accelerated algorithms: {e}")
+            _log.warning("Could not enable accelerated algorithms: %s", e)
 
     if verbose and results["total_enabled"] > 0:
-        print(f"\n✓ Fast LangGraph: {results['total_enabled']} optimizations enabled")
-        print("  Expected speedup: 2-4x for typical workflows")
+        _log.info(
+            "✓ Fast LangGraph: %d optimizations enabled\n"
+            "  Expected speedup: 2-4x for typical workflows",
+            results["total_enabled"],
+        )
 
     return results
 
@@ -92,7 +96,7 @@ def disable_all_optimizations(verbose: bool = True) -> bool:
     Disable all Fast LangGraph optimizations and restore original behavior.
 
     Args:
-        verbose: If True, print status messages
+        verbose: If True, log status messages
 
     Returns:
         True if all optimizations were successfully disabled
@@ -106,15 +110,16 @@ def disable_all_optimizations(verbose: bool = True) -> bool:
         shim.unpatch_langgraph()
     except Exception as e:
         if verbose:
-            print(f"⚠ Warning: Could not unpatch algorithms: {e}")
+            _log.warning("Could not unpatch algorithms: %s", e)
         success = False
 
-    # Note: Executor cache cannot be easily unpatched without restart
-    if verbose:
-        print("⚠ Note: Thread pool cache requires restart to fully disable")
+    # enable_all_optimizations() may have patched the executor directly
+    from .executor_cache import unpatch_langchain_executor
+
+    unpatch_langchain_executor()
 
     if verbose and success:
-        print("✓ Fast LangGraph optimizations disabled")
+        _log.info("✓ Fast LangGraph optimizations disabled")
 
     return success
 
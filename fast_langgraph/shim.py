@@ -27,15 +27,96 @@ Usage:
     enable_all_optimizations()
 """
 
+import functools
 import importlib
+import importlib.metadata
+import itertools
+import logging
 import sys
 import warnings
-from typing import Any, Callable, Dict
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-# Track what we've patched
-_patched_functions: Dict[str, Any] = {}
-_original_functions: Dict[str, Any] = {}
-_executor_cache_patched: bool = False
+_create_accelerated_apply_writes: Optional[Callable[[Any], Any]]
+try:
+    from .algo_shims import (
+        create_accelerated_apply_writes as _create_accelerated_apply_writes,
+    )
+except ImportError:
+    _create_accelerated_apply_writes = None
+
+_log = logging.getLogger(__name__)
+
+# Sentinel for attributes missing from a module namespace
+_MISSING = object()
+
+# Functions patched automatically, with the label used in the patch summary
+_COMPONENTS: Dict[str, str] = {"apply_writes": "apply_writes (1.2x speedup)"}
+
+# Per-module patch plan: (module_name, {func_name: accelerator_factory})
+_PatchPlan = Tuple[Tuple[str, Dict[str, Callable[[Any], Any]]], ...]
+
+# Components that require explicit usage, as (status key, package attribute)
+_MANUAL_COMPONENTS: Tuple[Tuple[str, str], ...] = (
+    ("rust_checkpointer", "RustSQLiteCheckpointer"),
+    ("rust_cache", "RustLLMCache"),
+)
+
+
+class _Registry:
+    """Patch tracking state, kept on one slotted object instead of globals."""
+
+    __slots__ = ("patched_funcs", "originals", "executor_cache_patched", "status")
+
+    def __init__(self) -> None:
+        # Accelerated and original functions, keyed by (module_name, func_name)
+        self.patched_funcs: Dict[Tuple[str, str], Any] = {}
+        self.originals: Dict[Tuple[str, str], Any] = {}
+        self.executor_cache_patched = False
+        # Result of get_patch_status(), reset whenever the patch state changes
+        self.status: Optional[Dict[str, Any]] = None
+
+
+_REG = _Registry()
+
+
+def _langgraph_version() -> Optional[Tuple[int, ...]]:
+    """
+    Return the installed langgraph version as a tuple of ints, without
+    importing langgraph, or None if it is not installed.
+    """
+    try:
+        version = importlib.metadata.version("langgraph")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+    parts = []
+    for part in version.split(".")[:3]:
+        digits = "".join(itertools.takewhile(str.isdigit, part))
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
+
+@functools.cache
+def _patch_plan() -> _PatchPlan:
+    """
+    Select the functions to patch for the installed langgraph, once.
+
+    The accelerated apply_writes follows the langgraph 0.6 signature and
+    internals (langgraph.pregel._algo), so older releases are left unpatched.
+    """
+    if _create_accelerated_apply_writes is None:
+        return ()
+
+    version = _langgraph_version()
+    if version is None or version < (0, 6):
+        return ()
+
+    return (
+        ("langgraph.pregel._algo", {"apply_writes": _create_accelerated_apply_writes}),
+    )
 
 
 def patch_langgraph(verbose: bool = True) -> bool:
@@ -54,7 +135,7 @@ def patch_langgraph(verbose: bool = True) -> bool:
        - Uses Rust FastChannelUpdater for batch channel updates
 
     Args:
-        verbose: If True, print status messages (default: True)
+        verbose: If True, log status messages (default: True)
 
     Returns:
         bool: True if at least one patch was applied, False otherwise.
@@ -64,56 +145,68 @@ def patch_langgraph(verbose: bool = True) -> bool:
         - RustSQLiteCheckpointer for fast checkpointing
         - @cached decorator for LLM response caching
         - langgraph_state_update for state merging
+
+        Calling this again once everything is patched returns True
+        immediately, without touching any module or logging again.
     """
-    global _executor_cache_patched
+    plan = _patch_plan()
+    if _REG.executor_cache_patched and all(
+        _is_wrapper_installed(module_name, func_name)
+        for module_name, factories in plan
+        for func_name in factories
+    ):
+        return True
 
     patches_applied = []
     patches_failed = []
 
     # 1. Patch executor caching (biggest win - 2.3x speedup)
-    if not _executor_cache_patched:
+    if not _REG.executor_cache_patched:
         try:
             from .executor_cache import patch_langchain_executor
 
             if patch_langchain_executor():
-                _executor_cache_patched = True
+                _REG.executor_cache_patched = True
+                _REG.status = None
                 patches_applied.append("executor_cache (2.3x speedup)")
         except ImportError:
             patches_failed.append("executor_cache (langchain_core not available)")
         except Exception as e:
+            _log.debug("Unexpected error patching executor_cache", exc_info=True)
             patches_failed.append(f"executor_cache ({e})")
 
-    # 2. Patch apply_writes with Rust acceleration
-    try:
-        from .algo_shims import create_accelerated_apply_writes
+    # 2. Patch the Pregel algorithm functions with Rust acceleration
+    if _create_accelerated_apply_writes is None:
+        patches_failed.append("apply_writes (algo_shims not available)")
 
-        if _patch_function(
-            "langgraph.pregel._algo", "apply_writes", create_accelerated_apply_writes
-        ):
-            patches_applied.append("apply_writes (1.2x speedup)")
-    except ImportError as e:
-        patches_failed.append(f"apply_writes ({e})")
-    except Exception as e:
-        patches_failed.append(f"apply_writes ({e})")
+    for module_name, factories in plan:
+        try:
+            patched = _patch_module_functions(module_name, factories)
+        except Exception as e:
+            _log.debug("Unexpected error patching %s", module_name, exc_info=True)
+            patches_failed.extend(f"{name} ({e})" for name in factories)
+            continue
+        patches_applied.extend(_COMPONENTS.get(name, name) for name in patched)
 
-    # Print summary
+    # Log summary as a single record
     if verbose:
-        if patches_applied:
-            print("✓ Fast LangGraph automatic acceleration enabled:")
-            for patch in patches_applied:
-                print(f"  • {patch}")
-            print()
-            print("  For additional speedups, use these manually:")
-            print("  • RustSQLiteCheckpointer - 5-6x faster checkpointing")
-            print("  • @cached decorator - LLM response caching")
-        else:
-            print("✓ Fast LangGraph loaded (no automatic patches applied)")
-
-        if patches_failed and verbose:
-            print()
-            print("  ⚠ Some patches could not be applied:")
-            for failure in patches_failed:
-                print(f"    - {failure}")
+        if _log.isEnabledFor(logging.INFO):
+            if patches_applied:
+                lines = ["✓ Fast LangGraph automatic acceleration enabled:"]
+                lines.extend(f"  • {patch}" for patch in patches_applied)
+                lines.append("")
+                lines.append("  For additional speedups, use these manually:")
+                lines.append("  • RustSQLiteCheckpointer - 5-6x faster checkpointing")
+                lines.append("  • @cached decorator - LLM response caching")
+            else:
+                lines = ["✓ Fast LangGraph loaded (no automatic patches applied)"]
+            _log.info("\n".join(lines))
+
+        if patches_failed:
+            _log.warning(
+                "Some Fast LangGraph patches could not be applied:\n%s",
+                "\n".join(f"  - {failure}" for failure in patches_failed),
+            )
 
     return len(patches_applied) > 0
 
@@ -122,99 +215,179 @@ def unpatch_langgraph(verbose: bool = True) -> bool:
     """
     Restore the original LangGraph implementations.
 
+    Patches are undone in the reverse of the order they were applied.
+
     Note:
-        Executor cache patching cannot be fully reversed without a restart.
-        The cached executors will continue to be reused until the process ends.
+        Executors already created by the executor cache stay alive until
+        shutdown_executor_cache() is called or the process ends.
 
     Args:
-        verbose: If True, print status messages (default: True)
+        verbose: If True, log status messages (default: True)
 
     Returns:
         bool: True if unpatching was successful, False otherwise.
     """
-    global _executor_cache_patched
-
     try:
         unpatched = []
 
-        for full_func_name, original_func in list(_original_functions.items()):
-            module_name, func_name = full_func_name.rsplit(".", 1)
-
-            if module_name in sys.modules:
-                module = sys.modules[module_name]
-                if hasattr(module, func_name):
-                    setattr(module, func_name, original_func)
-                    unpatched.append(full_func_name)
+        for (module_name, func_name), original_func in reversed(
+            list(_REG.originals.items())
+        ):
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            # Only restore over our own wrapper: after importlib.reload the
+            # name holds the new module's function, and putting the old
+            # original back would resurrect the stale module state it uses
+            current = module.__dict__.get(func_name, _MISSING)
+            if current is _REG.patched_funcs.get((module_name, func_name)):
+                module.__dict__[func_name] = original_func
+                unpatched.append(f"{module_name}.{func_name}")
+
+        # The executor cache was patched first, so it is restored last
+        if _REG.executor_cache_patched:
+            from .executor_cache import unpatch_langchain_executor
+
+            unpatch_langchain_executor()
+            _REG.executor_cache_patched = False
+            unpatched.append("executor_cache")
 
         # Clear tracking
-        _patched_functions.clear()
-        _original_functions.clear()
+        _REG.patched_funcs.clear()
+        _REG.originals.clear()
+        _REG.status = None
 
         if verbose:
             if unpatched:
-                print(f"✓ Successfully unpatched: {', '.join(unpatched)}")
+                _log.info("✓ Successfully unpatched: %s", ", ".join(unpatched))
             else:
-                print("✓ No function patches to remove")
-
-            if _executor_cache_patched:
-                print("  ⚠ Note: Executor cache requires restart to fully disable")
+                _log.info("✓ No patches to remove")
 
         return True
 
     except Exception as e:
         if verbose:
-            print(f"✗ Error during unpatching: {e}")
+            _log.error("Error during unpatching: %s", e)
         return False
 
 
-def _patch_function(
-    module_name: str, func_name: str, accelerator_factory: Callable[[Any], Any]
-) -> bool:
+def _is_wrapper_installed(module_name: str, func_name: str) -> bool:
+    """Check that our wrapper is still what the module name refers to."""
+    wrapper = _REG.patched_funcs.get((module_name, func_name))
+    module = sys.modules.get(module_name)
+    return (
+        wrapper is not None
+        and module is not None
+        and module.__dict__.get(func_name) is wrapper
+    )
+
+
+def _import_module(module_name: str) -> Optional[ModuleType]:
     """
-    Internal function to patch a specific function in a module.
+    Resolve a module, preferring the already-imported entry in sys.modules.
 
-    Args:
-        module_name: Name of the module to patch
-        func_name: Name of the function to patch
-        accelerator_factory: Function that takes the original function and returns accelerated version
+    importlib.import_module takes the import lock even for modules that are
+    already loaded, so only fall back to it on a miss.
 
     Returns:
-        bool: True if patching was successful, False otherwise.
+        The module, or None if it cannot be imported.
     """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
     try:
-        # Import the module
-        try:
-            module = importlib.import_module(module_name)
-        except ImportError:
-            # Module doesn't exist, skip
-            return False
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def _patch_module_functions(
+    module_name: str, factories: Dict[str, Callable[[Any], Any]]
+) -> List[str]:
+    """
+    Internal function to patch several functions of one module in a single pass.
+
+    The module is resolved once and all replacements are applied with a single
+    update of its namespace, rather than one import and setattr per function.
 
-        # Check if the function exists in the module
-        if not hasattr(module, func_name):
+    Args:
+        module_name: Name of the module to patch
+        factories: Mapping of function name to a factory that takes the original
+            function and returns the accelerated version
+
+    Functions that are already patched are left alone and reported as patched,
+    so calling this repeatedly is safe.
+
+    Returns:
+        List of the function names that are patched.
+    """
+    module = _import_module(module_name)
+    if module is None:
+        # Module doesn't exist, skip
+        return []
+
+    originals: Dict[str, Any] = {}
+    replacements: Dict[str, Any] = {}
+    already_patched: List[str] = []
+
+    for func_name, accelerator_factory in factories.items():
+        # Look in the namespace directly: hasattr/getattr would fall through
+        # to a lazy-loading module __getattr__ and could import things
+        original_func = module.__dict__.get(func_name, _MISSING)
+        if original_func is _MISSING:
             warnings.warn(
                 f"Function {func_name} not found in {module_name}", RuntimeWarning
             )
-            return False
-
-        # Store the original function for later restoration
-        original_func = getattr(module, func_name)
-        full_func_name = f"{module_name}.{func_name}"
-        _original_functions[full_func_name] = original_func
+            continue
+
+        # Never wrap our own wrapper: the second patch_langgraph() call would
+        # otherwise record it as the "original", breaking unpatching and
+        # adding an extra call layer to every invocation. If the module was
+        # reloaded since, the name holds a fresh function and is patched again,
+        # replacing the stale tracking entries.
+        if _REG.patched_funcs.get((module_name, func_name)) is original_func or getattr(
+            original_func, "__fast_langgraph_wrapped__", False
+        ):
+            already_patched.append(func_name)
+            continue
 
         # Create accelerated version
-        accelerated_func = accelerator_factory(original_func)
+        try:
+            accelerated_func = accelerator_factory(original_func)
+        except Exception as e:
+            warnings.warn(
+                f"Failed to patch {module_name}.{func_name}: {e}", RuntimeWarning
+            )
+            continue
 
-        # Replace the function in the module
-        setattr(module, func_name, accelerated_func)
+        # Factories hand back the original when no acceleration is available
+        if accelerated_func is original_func:
+            continue
 
-        # Track that we've patched this function
-        _patched_functions[full_func_name] = accelerated_func
+        try:
+            accelerated_func.__fast_langgraph_wrapped__ = True
+        except (AttributeError, TypeError):
+            pass
 
-        return True
+        replacements[func_name] = accelerated_func
+        originals[func_name] = original_func
 
-    except Exception as e:
-        warnings.warn(f"Failed to patch {module_name}.{func_name}: {e}", RuntimeWarning)
-        return False
+    if not replacements:
+        return already_patched
+
+    # Replace the functions in the module
+    vars(module).update(replacements)
+    _REG.status = None
+
+    # Store the originals for later restoration and track what we've patched
+    _REG.originals.update(
+        {(module_name, name): func for name, func in originals.items()}
+    )
+    _REG.patched_funcs.update(
+        {(module_name, name): func for name, func in replacements.items()}
+    )
+
+    return already_patched + list(replacements)
 
 
 def is_func_patched(module_name: str, func_name: str) -> bool:
@@ -228,8 +401,7 @@ def is_func_patched(module_name: str, func_name: str) -> bool:
     Returns:
         bool: True if the function has been patched, False otherwise.
     """
-    full_func_name = f"{module_name}.{func_name}"
-    return full_func_name in _original_functions
+    return (module_name, func_name) in _REG.originals
 
 
 def get_patch_status() -> Dict[str, Any]:
@@ -249,29 +421,26 @@ def get_patch_status() -> Dict[str, Any]:
             },
             'summary': str  # Human-readable summary
         }
+
+        The dict is cached until the patch state changes, so repeated calls
+        return the same object; treat it as read-only.
     """
+    if _REG.status is not None:
+        return _REG.status
+
     # Check automatic patches
-    automatic = {
-        "executor_cache": _executor_cache_patched,
-        "apply_writes": is_func_patched("langgraph.pregel._algo", "apply_writes"),
-    }
+    patched_funcs = {func_name for _, func_name in _REG.originals}
+    automatic = {"executor_cache": _REG.executor_cache_patched}
+    automatic.update((name, name in patched_funcs) for name in _COMPONENTS)
 
     # Check manual component availability
-    manual = {"rust_checkpointer": False, "rust_cache": False}
-
-    try:
-        from . import RustSQLiteCheckpointer  # noqa: F401
-
-        manual["rust_checkpointer"] = True
-    except ImportError:
-        pass
-
-    try:
-        from . import RustLLMCache  # noqa: F401
+    from . import _load_extension
 
-        manual["rust_cache"] = True
-    except ImportError:
-        pass
+    extension = _load_extension()
+    manual = {
+        key: extension is not None and hasattr(extension, attr)
+        for key, attr in _MANUAL_COMPONENTS
+    }
 
     # Generate summary
     auto_count = sum(automatic.values())
@@ -289,7 +458,8 @@ def get_patch_status() -> Dict[str, Any]:
     if manual_count > 0:
         summary += f", {manual_count} manual components available"
 
-    return {"automatic": automatic, "manual": manual, "summary": summary}
+    _REG.status = {"automatic": automatic, "manual": manual, "summary": summary}
+    return _REG.status
 
 
 def is_patched() -> bool:
@@ -299,7 +469,7 @@ def is_patched() -> bool:
     Returns:
         bool: True if at least one acceleration is active, False otherwise.
     """
-    return len(_original_functions) > 0 or _executor_cache_patched
+    return len(_REG.originals) > 0 or _REG.executor_cache_patched
 
 
 def print_status() -> None:
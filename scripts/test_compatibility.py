@@ -12,11 +12,15 @@ This script:
 """
 
 import argparse
+import hashlib
+import logging
+import logging.handlers
 import os
 import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -34,6 +38,22 @@ class Colors:
     NC = '\033[0m'  # No Color
 
 
+def _create_logger() -> logging.Logger:
+    """Create the status logger, buffered and written to stdout in batches"""
+    logger = logging.getLogger("fast_langgraph.compatibility")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if not logger.handlers:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(
+            logging.handlers.MemoryHandler(
+                capacity=64, flushLevel=logging.ERROR, target=stream
+            )
+        )
+    return logger
+
+
 class CompatibilityTester:
     """Manages the compatibility testing process"""
 
@@ -44,42 +64,70 @@ class CompatibilityTester:
         test_dir: Optional[Path] = None,
         keep_test_dir: bool = False,
         verbose: bool = False,
+        use_cache: bool = False,
+        parallel: bool = True,
     ):
         self.langgraph_repo = langgraph_repo
         self.langgraph_branch = langgraph_branch
         self.keep_test_dir = keep_test_dir
         self.verbose = verbose
+        self.parallel = parallel
+        self.fast_langgraph_root = Path(__file__).parent.parent
 
+        # With use_cache and no explicit directory, reuse a persistent cache so
+        # repeat runs skip the clone and most of the Rust build; the cache is
+        # never cleaned up. The venv inside it is still recreated every run.
+        self.cargo_target_dir: Optional[Path] = None
         if test_dir:
             self.test_dir = Path(test_dir)
+        elif use_cache:
+            self.test_dir = self.cache_dir()
+            self.cargo_target_dir = self.test_dir / "target"
+            self.keep_test_dir = True
         else:
             self.test_dir = Path.cwd() / ".langgraph-test"
 
         self.venv_dir = self.test_dir / "venv"
         self.langgraph_dir = self.test_dir / "langgraph"
-        self.fast_langgraph_root = Path(__file__).parent.parent
+        self.log = _create_logger()
+
+    def cache_dir(self) -> Path:
+        """Cache directory keyed by LangGraph repo and branch"""
+        # Dependency changes need no new key: cargo rebuilds what changed in
+        # the target dir, and the venv is recreated on every run
+        digest = hashlib.sha256()
+        digest.update(f"{self.langgraph_repo}\0{self.langgraph_branch}".encode())
+        return Path.home() / ".cache" / "fast-langgraph" / digest.hexdigest()[:12]
+
+    def flush_output(self):
+        """Write out buffered status messages"""
+        for handler in self.log.handlers:
+            handler.flush()
 
     def print_header(self):
         """Print the test header"""
-        print(f"\n{Colors.BLUE}{'=' * 62}{Colors.NC}")
-        print(f"{Colors.BLUE}   Fast LangGraph - LangGraph Compatibility Tests{Colors.NC}")
-        print(f"{Colors.BLUE}{'=' * 62}{Colors.NC}\n")
+        rule = f"{Colors.BLUE}{'=' * 62}{Colors.NC}"
+        self.log.info(
+            f"\n{rule}\n"
+            f"{Colors.BLUE}   Fast LangGraph - LangGraph Compatibility Tests{Colors.NC}\n"
+            f"{rule}\n"
+        )
 
     def print_status(self, message: str):
         """Print a status message"""
-        print(f"{Colors.BLUE}[*]{Colors.NC} {message}")
+        self.log.info(f"{Colors.BLUE}[*]{Colors.NC} {message}")
 
     def print_success(self, message: str):
         """Print a success message"""
-        print(f"{Colors.GREEN}[✓]{Colors.NC} {message}")
+        self.log.info(f"{Colors.GREEN}[✓]{Colors.NC} {message}")
 
     def print_error(self, message: str):
         """Print an error message"""
-        print(f"{Colors.RED}[✗]{Colors.NC} {message}")
+        self.log.error(f"{Colors.RED}[✗]{Colors.NC} {message}")
 
     def print_warning(self, message: str):
         """Print a warning message"""
-        print(f"{Colors.YELLOW}[!]{Colors.NC} {message}")
+        self.log.warning(f"{Colors.YELLOW}[!]{Colors.NC} {message}")
 
     def run_command(
         self,
@@ -88,55 +136,127 @@ class CompatibilityTester:
         check: bool = True,
         capture_output: bool = False,
         env: Optional[dict] = None,
+        echo: bool = False,
     ) -> subprocess.CompletedProcess:
-        """Run a shell command"""
+        """
+        Run a shell command.
+
+        With capture_output, stderr is merged into stdout and read line by line
+        while the command runs; with echo, each line is also written to stdout
+        as soon as it arrives instead of after the command exits.
+        """
         if self.verbose:
-            print(f"  Running: {' '.join(cmd)}")
+            self.log.info(f"  Running: {' '.join(cmd)}")
+
+        # The child writes to our stdout too, so emit what is buffered first
+        self.flush_output()
 
-        return subprocess.run(
+        if not capture_output:
+            return subprocess.run(cmd, cwd=cwd, check=check, text=True, env=env)
+
+        lines = []
+        with subprocess.Popen(
             cmd,
             cwd=cwd,
-            check=check,
-            capture_output=capture_output,
-            text=True,
             env=env,
-        )
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        ) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                lines.append(line)
+                if echo:
+                    sys.stdout.write(line)
+
+        output = "".join(lines)
+        if check and proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout=output, stderr="")
 
     def setup_test_environment(self):
         """Set up the test environment"""
         self.print_status("Setting up test environment...")
-        self.test_dir.mkdir(exist_ok=True)
+        self.test_dir.mkdir(parents=True, exist_ok=True)
         self.print_success("Test environment ready")
 
     def clone_langgraph(self):
         """Clone the LangGraph repository"""
-        if self.langgraph_dir.exists():
-            self.print_warning("LangGraph directory exists, pulling latest changes...")
+        if (self.langgraph_dir / ".git").exists():
+            self.print_warning("LangGraph checkout exists, updating it...")
+            # Shallow fetch + hard reset: no merge, and it also undoes any
+            # conftest left modified by an interrupted run
+            self.run_command(
+                ["git", "fetch", "--depth", "1", "origin", self.langgraph_branch],
+                cwd=self.langgraph_dir,
+            )
             self.run_command(
-                ["git", "pull", "origin", self.langgraph_branch],
+                ["git", "reset", "--hard", "FETCH_HEAD"],
                 cwd=self.langgraph_dir,
             )
         else:
             self.print_status(f"Cloning LangGraph (branch: {self.langgraph_branch})...")
-            self.run_command([
+            clone_cmd = [
                 "git", "clone",
                 "--depth", "1",
                 "--branch", self.langgraph_branch,
                 self.langgraph_repo,
                 str(self.langgraph_dir),
-            ])
+            ]
+            if self._git_supports_sparse_clone():
+                # Partial clone: fetch blobs only for the paths checked out below
+                self.run_command(clone_cmd[:2] + ["--filter=blob:none", "--sparse"] + clone_cmd[2:])
+                self._configure_sparse_checkout()
+            else:
+                self.run_command(clone_cmd)
             self.print_success("LangGraph cloned successfully")
 
         # Check for monorepo structure
-        libs_langgraph = self.langgraph_dir / "libs" / "langgraph"
-        if libs_langgraph.exists():
+        if "langgraph" in self._subdirs(self.langgraph_dir / "libs"):
             self.print_status("Detected monorepo structure")
-            self.langgraph_dir = libs_langgraph
+            self.langgraph_dir = self.langgraph_dir / "libs" / "langgraph"
+
+    @staticmethod
+    def _subdirs(path: Path) -> set:
+        """Names of the directories directly under path, from a single scandir"""
+        try:
+            with os.scandir(path) as entries:
+                # DirEntry.is_dir() uses the d_type from the directory listing,
+                # so this costs no per-entry stat() on most filesystems
+                return {entry.name for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
+    # Monorepo package checked out when cloning sparsely
+    _SPARSE_PATHS = ("libs/langgraph",)
+
+    def _git_supports_sparse_clone(self) -> bool:
+        """`git clone --sparse` and `git sparse-checkout set` need git >= 2.25"""
+        result = self.run_command(["git", "--version"], capture_output=True, check=False)
+        match = re.search(r"(\d+)\.(\d+)", result.stdout)
+        return bool(match) and (int(match.group(1)), int(match.group(2))) >= (2, 25)
+
+    def _configure_sparse_checkout(self):
+        """Check out only the LangGraph package, or everything if not a monorepo"""
+        listing = self.run_command(
+            ["git", "ls-tree", "-d", "--name-only", "HEAD", *self._SPARSE_PATHS],
+            cwd=self.langgraph_dir,
+            capture_output=True,
+        )
+        if listing.stdout.strip():
+            self.run_command(
+                ["git", "sparse-checkout", "set", *self._SPARSE_PATHS],
+                cwd=self.langgraph_dir,
+            )
+        else:
+            self.run_command(["git", "sparse-checkout", "disable"], cwd=self.langgraph_dir)
 
     def create_virtualenv(self):
         """Create a virtual environment"""
         self.print_status("Creating virtual environment...")
-        self.run_command([sys.executable, "-m", "venv", str(self.venv_dir)])
+        # --clear so a kept or cached test directory never reuses stale packages
+        self.run_command([sys.executable, "-m", "venv", "--clear", str(self.venv_dir)])
 
         # Get the python executable in the venv
         if sys.platform == "win32":
@@ -148,9 +268,80 @@ class CompatibilityTester:
 
         self.print_success("Virtual environment created")
 
+    # Test dependencies installed alongside LangGraph
+    _TEST_DEPENDENCIES = (
+        "pytest", "pytest-asyncio", "pytest-mock", "pytest-timeout", "pytest-xdist",
+        "syrupy",  # For snapshot testing (modern snapshot library)
+        "redis", "httpx", "aiohttp", "requests", "aiosqlite",
+        # Common LangGraph optional dependencies
+        "langchain-core", "langsmith",
+    )
+
+    # Test files that are always ignored: they require fixtures from the
+    # original conftest that we can't easily replicate
+    _REQUIRED_IGNORES = (
+        "--ignore=tests/test_checkpoint_migration.py",
+        "--ignore=tests/test_large_cases.py",
+        "--ignore=tests/test_large_cases_async.py",  # needs trio optional dep
+        "--ignore=tests/test_pregel_async.py",
+        "--ignore=tests/test_remote_graph.py",
+        "--ignore=tests/test_messages.py",
+        "--ignore=tests/test_interruption.py",  # needs durability fixture
+        "--ignore=tests/test_pregel.py",  # needs complex fixtures
+        "--ignore=tests/test_graph_validation.py",  # may need fixtures
+        "--ignore=tests/test_runnable.py",  # needs trio optional dep
+        "--ignore=tests/test_runtime.py",  # needs trio optional dep
+        "--ignore=tests/test_utils.py",  # needs trio optional dep
+        "--ignore-glob=**/test_cache.py",
+    )
+
+    # Override pytest.ini settings; a flag/value pair, so it is never deduplicated
+    _OVERRIDE_ADDOPTS = ("-o", "addopts=")
+
+    # Stands in for LangGraph's top-level tests/conftest.py only; nested
+    # conftests still load. The shim hook and the common fixtures come from
+    # fast_langgraph._pytest_plugin, but names that tests import from
+    # tests.conftest have to live in the module itself.
+    _CONFTEST_OVERRIDE = '''"""Minimal conftest for compatibility testing"""
+import os
+
+# Constants that other tests might import
+NO_DOCKER = True  # Skip docker-dependent tests
+IS_MACOS = os.uname().sysname == "Darwin" if hasattr(os, "uname") else False
+'''
+
+    @staticmethod
+    def _has_xdist_option(test_options: list) -> bool:
+        """Whether the pytest options already choose an xdist worker count"""
+        return any(
+            opt.startswith(("-n", "--numprocesses")) for opt in test_options
+        )
+
+    def pip_env(self) -> dict:
+        """Environment shared by all pip invocations"""
+        return {**os.environ, "PIP_NO_INPUT": "1", "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+
+    def _langgraph_install_target(self, env: dict) -> str:
+        """Pick the richest extra LangGraph provides, probing with a dry run"""
+        for extra in ["dev", "test"]:
+            probe = self.run_command(
+                [str(self.venv_pip), "install", "--dry-run", "-e", f".[{extra}]"],
+                cwd=self.langgraph_dir,
+                check=False,
+                capture_output=True,
+                env=env,
+            )
+            # pip only warns (and still succeeds) when an extra is missing
+            if probe.returncode == 0 and "does not provide the extra" not in (
+                probe.stdout + probe.stderr
+            ):
+                return f".[{extra}]"
+        return "."
+
     def install_langgraph(self):
         """Install LangGraph and its dependencies"""
         self.print_status("Installing LangGraph and dependencies...")
+        env = self.pip_env()
 
         # Upgrade pip
         self.run_command([
@@ -158,56 +349,22 @@ class CompatibilityTester:
             "install",
             "--upgrade",
             "pip", "setuptools", "wheel",
-        ])
-
-        # Install LangGraph with all extras if possible
-        install_cmd = [str(self.venv_pip), "install", "-e"]
-
-        # Try dev, then test, then basic
-        for extra in ["dev", "test", None]:
-            try:
-                if extra:
-                    self.run_command(
-                        install_cmd + [f".[{extra}]"],
-                        cwd=self.langgraph_dir,
-                        capture_output=True,
-                    )
-                else:
-                    self.run_command(
-                        install_cmd + ["."],
-                        cwd=self.langgraph_dir,
-                    )
-                break
-            except subprocess.CalledProcessError:
-                if extra is None:
-                    raise
-                continue
-
-        # Ensure pytest and common test dependencies are installed
-        self.print_status("Installing test dependencies...")
-        self.run_command([
-            str(self.venv_pip),
-            "install",
-            "pytest", "pytest-asyncio", "pytest-mock", "pytest-timeout", "pytest-xdist",
-            "syrupy",  # For snapshot testing (modern snapshot library)
-            "redis", "httpx", "aiohttp", "requests", "aiosqlite",
-        ])
-
-        # Install common LangGraph optional dependencies
-        try:
-            self.run_command([
-                str(self.venv_pip),
-                "install",
-                "langchain-core", "langsmith",
-            ], check=False)
-        except Exception:
-            pass  # These are optional
+        ], env=env)
+
+        # Install LangGraph with dev or test extras if available, together with
+        # the test dependencies, so pip resolves everything in one run
+        target = self._langgraph_install_target(env)
+        self.print_status(f"Installing LangGraph ({target}) and test dependencies...")
+        self.run_command(
+            [str(self.venv_pip), "install", "-e", target, *self._TEST_DEPENDENCIES],
+            cwd=self.langgraph_dir,
+            env=env,
+        )
 
         self.print_success("LangGraph and test dependencies installed")
 
-    def install_fast_langgraph(self):
-        """Build and install Fast LangGraph"""
-        self.print_status("Building and installing Fast LangGraph...")
+    def install_maturin(self):
+        """Install maturin into the virtual environment"""
         self.print_status(f"Fast LangGraph root: {self.fast_langgraph_root}")
 
         # Verify we're in the right directory
@@ -217,41 +374,88 @@ class CompatibilityTester:
             self.print_error(f"Current fast_langgraph_root: {self.fast_langgraph_root}")
             raise FileNotFoundError(f"Cargo.toml not found at {cargo_toml}")
 
-        # Install maturin
         self.run_command([
             str(self.venv_pip),
             "install",
             "maturin",
-        ])
+        ], env=self.pip_env())
 
         # Get maturin path
         if sys.platform == "win32":
-            maturin = self.venv_dir / "Scripts" / "maturin.exe"
+            self.maturin = self.venv_dir / "Scripts" / "maturin.exe"
         else:
-            maturin = self.venv_dir / "bin" / "maturin"
+            self.maturin = self.venv_dir / "bin" / "maturin"
+
+    def maturin_env(self) -> dict:
+        """Environment for maturin builds"""
+        # ~/.cargo/bin goes first on PATH; a missing directory is harmless
+        env = {
+            **os.environ,
+            "PATH": f"{Path.home() / '.cargo' / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}",
+            # Set VIRTUAL_ENV so maturin knows where to install
+            "VIRTUAL_ENV": str(self.venv_dir),
+            "CARGO_INCREMENTAL": "1",
+        }
 
-        # Build and install
+        # Keep the compiled crate in the cache for incremental rebuilds. That
+        # build is private to this machine, so it can also target this CPU
+        # (SIMD); a shared target dir keeps the caller's RUSTFLAGS as they are
+        if self.cargo_target_dir is not None:
+            env["CARGO_TARGET_DIR"] = str(self.cargo_target_dir)
+            rustflags = os.environ.get("RUSTFLAGS", "")
+            env["RUSTFLAGS"] = f"{rustflags} -C target-cpu=native".strip()
+        return env
+
+    def build_fast_langgraph(self):
+        """Compile the Rust extension without installing it, to warm the build cache"""
         self.print_status("Building Rust extension (this may take a few minutes)...")
+        self.run_command([
+            str(self.maturin),
+            "build",
+            "--release",
+            # Same interpreter as `maturin develop`, so the artifacts match
+            "--interpreter", str(self.venv_python),
+            "--out", str(self.test_dir / "wheels"),
+        ], cwd=self.fast_langgraph_root, env=self.maturin_env())
 
-        # Setup environment for maturin
-        env = os.environ.copy()
-
-        # Add Rust toolchain to PATH if it exists in ~/.cargo/bin
-        cargo_bin = Path.home() / ".cargo" / "bin"
-        if cargo_bin.exists():
-            env["PATH"] = f"{cargo_bin}:{env.get('PATH', '')}"
-
-        # Set VIRTUAL_ENV so maturin knows where to install
-        env["VIRTUAL_ENV"] = str(self.venv_dir)
+    def install_fast_langgraph(self):
+        """Build and install Fast LangGraph"""
+        self.print_status("Installing Fast LangGraph...")
 
+        # Reuses the artifacts from build_fast_langgraph(), so this is quick
         self.run_command([
-            str(maturin),
+            str(self.maturin),
             "develop",
             "--release",
-        ], cwd=self.fast_langgraph_root, env=env)
+        ], cwd=self.fast_langgraph_root, env=self.maturin_env())
 
         self.print_success("Fast LangGraph installed")
 
+    def prepare(self):
+        """
+        Set up LangGraph and Fast LangGraph, overlapping independent phases.
+
+        Cloning and venv creation are independent; after that, the Rust build
+        runs while pip installs LangGraph. All phases are subprocesses, so
+        threads are enough to overlap them.
+        """
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            clone = pool.submit(self.clone_langgraph)
+            venv = pool.submit(self.create_virtualenv)
+            venv.result()
+            clone.result()
+
+            # maturin goes in before the parallel phase so the two pip runs
+            # never modify the venv at the same time
+            self.install_maturin()
+
+            install = pool.submit(self.install_langgraph)
+            build = pool.submit(self.build_fast_langgraph)
+            install.result()
+            build.result()
+
+        self.install_fast_langgraph()
+
     def create_test_runner(self) -> Path:
         """Create the test runner script"""
         self.print_status("Creating test runner...")
@@ -259,44 +463,48 @@ class CompatibilityTester:
         test_runner = self.test_dir / "run_tests.py"
         test_runner.write_text('''#!/usr/bin/env python3
 """Test runner with Fast LangGraph shim applied"""
+import os
 import sys
 
-print("=" * 60)
-print("Applying Fast LangGraph shim...")
-print("=" * 60)
+rule = "=" * 60
+banner = [rule, "Applying Fast LangGraph shim...", rule]
 
 try:
     import fast_langgraph
 
     if not fast_langgraph.is_rust_available():
-        print("ERROR: Rust implementation not available!")
+        sys.stdout.write("\\n".join(banner + ["ERROR: Rust implementation not available!"]) + "\\n")
         sys.exit(1)
 
-    print(f"✓ Fast LangGraph loaded")
-    print(f"✓ Rust available: {fast_langgraph.is_rust_available()}")
+    banner.append("✓ Fast LangGraph loaded")
+    banner.append("✓ Rust available: True")
 
     # Apply the patch
     success = fast_langgraph.shim.patch_langgraph()
 
     if success:
-        print("✓ Successfully patched LangGraph")
+        banner.append("✓ Successfully patched LangGraph")
 
         # Show what was patched
         status = fast_langgraph.shim.get_patch_status()
-        patched = [k for k, v in status.items() if v]
+        patched = [k for k, v in status["automatic"].items() if v]
         if patched:
-            print(f"✓ Patched {len(patched)} components")
-            for component in patched:
-                print(f"  - {component}")
+            banner.append(f"✓ Patched {len(patched)} components")
+            banner.extend(f"  - {component}" for component in patched)
     else:
-        print("⚠ Patching failed")
+        banner.append("⚠ Patching failed")
 
-    print("=" * 60)
+    banner.append(rule)
+    # One write instead of a print() per line
+    sys.stdout.write("\\n".join(banner) + "\\n")
+    sys.stdout.flush()
 
 except Exception as e:
-    print(f"ERROR: Failed to apply shim: {e}")
-    import traceback
-    traceback.print_exc()
+    sys.stdout.write("\\n".join(banner + [f"ERROR: Failed to apply shim: {e}"]) + "\\n")
+    sys.stdout.flush()
+    if os.environ.get("FAST_LANGGRAPH_DEBUG"):
+        import traceback
+        traceback.print_exc()
     sys.exit(1)
 
 # Run pytest
@@ -308,171 +516,98 @@ sys.exit(pytest.main(sys.argv[1:]))
         self.print_success("Test runner created")
         return test_runner
 
+    def _pytest_options(self, test_options: list) -> list:
+        """Full pytest argument list for the user-provided options"""
+        # Default options if none provided
+        if not test_options:
+            test_options = ["-v", "--continue-on-collection-errors"]
+
+        # Append the required ignores not already given; the user's own options
+        # are kept verbatim, since repeated flags like -o or -p carry values
+        seen = set(test_options)
+        test_options = [
+            *test_options, *(i for i in self._REQUIRED_IGNORES if i not in seen)
+        ]
+        test_options += self._OVERRIDE_ADDOPTS
+        if self.parallel and not self._has_xdist_option(test_options):
+            # pytest-xdist is installed with the test dependencies; loadfile
+            # keeps each file on one worker so module-level fixtures are shared
+            test_options += ["-n", str(os.cpu_count() or 1), "--dist=loadfile"]
+        return test_options
+
     def run_tests(self, test_runner: Path, test_options: list):
         """Run the tests"""
         self.print_status("Running LangGraph tests with Fast LangGraph shim...")
 
         # Find test directory
         test_path = None
-        for possible_path in ["tests", "langgraph/tests"]:
-            path = self.langgraph_dir / possible_path
-            if path.exists():
-                test_path = path
+        for parent in (self.langgraph_dir, self.langgraph_dir / "langgraph"):
+            if "tests" in self._subdirs(parent):
+                test_path = parent / "tests"
                 break
 
         if not test_path:
             self.print_error("Could not find tests directory!")
             sys.exit(1)
 
-        # Handle problematic conftest
+        # LangGraph's top-level conftest needs services and fixtures we don't
+        # set up. Swap it for a minimal one for the duration of the run and
+        # load our plugin, which applies the shim before collection and
+        # provides the common fixtures.
         conftest_path = test_path / "conftest.py"
         conftest_backup = test_path / "conftest.py.orig"
-
         if conftest_path.exists():
             self.print_status("Creating minimal conftest to avoid import errors...")
-            # Backup original
             shutil.copy(conftest_path, conftest_backup)
-
-            # Create minimal conftest with monkeypatch applied BEFORE test collection
-            # Include common fixtures that tests might need
-            conftest_path.write_text('''"""Minimal conftest for compatibility testing"""
-import pytest
-import os
-import sys
-
-pytest_plugins = []
-
-# Apply Fast LangGraph shim BEFORE pytest collects tests
-def pytest_configure(config):
-    """Called before test collection starts"""
-    import fast_langgraph.shim
-    fast_langgraph.shim.patch_langgraph()
-
-# Constants that other tests might import
-NO_DOCKER = True  # Skip docker-dependent tests
-IS_MACOS = os.uname().sysname == "Darwin" if hasattr(os, 'uname') else False
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for async tests"""
-    import asyncio
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-# Checkpointer fixtures - commonly required by LangGraph tests
-@pytest.fixture
-def checkpointer():
-    """Basic in-memory checkpointer fixture"""
-    from langgraph.checkpoint.memory import MemorySaver
-    return MemorySaver()
-
-@pytest.fixture
-def sync_checkpointer():
-    """Sync checkpointer fixture"""
-    from langgraph.checkpoint.memory import MemorySaver
-    return MemorySaver()
-
-@pytest.fixture
-async def async_checkpointer():
-    """Async checkpointer fixture"""
-    from langgraph.checkpoint.memory import MemorySaver
-    return MemorySaver()
-
-# Store fixture for tests that need it
-@pytest.fixture
-def store():
-    """Basic store fixture"""
-    try:
-        from langgraph.store.memory import InMemoryStore
-        return InMemoryStore()
-    except ImportError:
-        return None
-''')
+            conftest_path.write_text(self._CONFTEST_OVERRIDE)
+        env = {**os.environ, "PYTEST_PLUGINS": "fast_langgraph._pytest_plugin"}
 
         self.print_status(f"Test path: {test_path}")
-        print()
-
-        # Always add required ignore options for tests with complex fixtures
-        # These tests require fixtures from original conftest that we can't easily replicate
-        required_ignores = [
-            "--ignore=tests/test_checkpoint_migration.py",
-            "--ignore=tests/test_large_cases.py",
-            "--ignore=tests/test_large_cases_async.py",  # needs trio optional dep
-            "--ignore=tests/test_pregel_async.py",
-            "--ignore=tests/test_remote_graph.py",
-            "--ignore=tests/test_messages.py",
-            "--ignore=tests/test_interruption.py",  # needs durability fixture
-            "--ignore=tests/test_pregel.py",  # needs complex fixtures
-            "--ignore=tests/test_graph_validation.py",  # may need fixtures
-            "--ignore=tests/test_runnable.py",  # needs trio optional dep
-            "--ignore=tests/test_runtime.py",  # needs trio optional dep
-            "--ignore=tests/test_utils.py",  # needs trio optional dep
-            "--ignore-glob=**/test_cache.py",
-            "-o", "addopts=",  # Override pytest.ini settings
-        ]
-
-        # Default options if none provided
-        if not test_options:
-            test_options = ["-v", "--continue-on-collection-errors"]
+        self.log.info("")
 
-        # Merge required ignores with user-provided options
-        # Add ignores that aren't already present
-        for ignore in required_ignores:
-            if ignore not in test_options:
-                test_options.append(ignore)
+        test_options = self._pytest_options(test_options)
 
         # Store ignored files for report
-        self._ignored_files = [i for i in required_ignores if i.startswith("--ignore")]
+        self._ignored_files = list(self._REQUIRED_IGNORES)
 
-        # Run tests directly with pytest (conftest will apply the shim)
+        # Run tests directly with pytest (the plugin will apply the shim)
         try:
             result = self.run_command(
                 [str(self.venv_python), "-m", "pytest", str(test_path)] + test_options,
                 cwd=self.langgraph_dir,
                 capture_output=True,
                 check=False,
+                env=env,
+                echo=True,
             )
 
-            # Print output
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
-
             # Parse test results from output
             self._parse_test_results(result.stdout)
 
-            # Restore conftest
-            if conftest_backup.exists():
-                shutil.copy(conftest_backup, conftest_path)
-                conftest_backup.unlink()
-
             if result.returncode == 0:
-                print()
+                self.log.info("")
                 self.print_success("All tests passed! ✨")
-                print()
-                print(f"{Colors.GREEN}{'=' * 62}{Colors.NC}")
-                print(f"{Colors.GREEN}  Fast LangGraph is fully compatible with LangGraph! 🎉{Colors.NC}")
-                print(f"{Colors.GREEN}{'=' * 62}{Colors.NC}")
+                rule = f"{Colors.GREEN}{'=' * 62}{Colors.NC}"
+                self.log.info(
+                    f"\n{rule}\n"
+                    f"{Colors.GREEN}  Fast LangGraph is fully compatible with LangGraph! 🎉{Colors.NC}\n"
+                    f"{rule}"
+                )
                 return True
             else:
-                print()
+                self.log.info("")
                 self.print_error("Some tests failed")
-                print()
+                self.log.info("")
                 self.print_warning("Review the test output above for details")
                 return False
 
         except Exception as e:
-            print()
+            self.log.info("")
             self.print_error(f"Error running tests: {e}")
-
-            # Restore conftest
-            if conftest_backup.exists():
-                shutil.copy(conftest_backup, conftest_path)
-                conftest_backup.unlink()
-
             return False
+        finally:
+            if conftest_backup.exists():
+                shutil.move(conftest_backup, conftest_path)
 
     def _parse_test_results(self, output: str) -> None:
         """Parse pytest output to extract test counts."""
@@ -615,6 +750,9 @@ python scripts/test_compatibility.py -v
 
 # Test against a specific LangGraph branch
 python scripts/test_compatibility.py --branch v0.2.0 -v
+
+# Reuse the LangGraph checkout and Rust build between runs
+python scripts/test_compatibility.py --cache -v
 ```
 """
         return report
@@ -670,10 +808,7 @@ python scripts/test_compatibility.py --branch v0.2.0 -v
         try:
             self.print_header()
             self.setup_test_environment()
-            self.clone_langgraph()
-            self.create_virtualenv()
-            self.install_langgraph()
-            self.install_fast_langgraph()
+            self.prepare()
             test_runner = self.create_test_runner()
             success = self.run_tests(test_runner, test_options)
 
@@ -691,7 +826,7 @@ python scripts/test_compatibility.py --branch v0.2.0 -v
             return success
 
         except KeyboardInterrupt:
-            print()
+            self.log.info("")
             self.print_warning("Test interrupted by user")
             return False
 
@@ -699,12 +834,15 @@ python scripts/test_compatibility.py --branch v0.2.0 -v
             self.print_error(f"Error during testing: {e}")
             if self.verbose:
                 import traceback
+
+                self.flush_output()
                 traceback.print_exc()
             return False
 
         finally:
             if not self.keep_test_dir:
                 self.cleanup()
+            self.flush_output()
 
 
 def main():
@@ -730,6 +868,12 @@ def main():
         help="Test directory (default: .langgraph-test)",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse the checkout and Rust build from a cache under ~/.cache/fast-langgraph",
+    )
+
     parser.add_argument(
         "--keep",
         action="store_true",
@@ -742,6 +886,12 @@ def main():
         help="Verbose output",
     )
 
+    parser.add_argument(
+        "--no-parallel",
+        action="store_true",
+        help="Run LangGraph's tests in a single process (no pytest-xdist)",
+    )
+
     parser.add_argument(
         "--no-report",
         action="store_true",
@@ -765,6 +915,8 @@ def main():
         test_dir=args.test_dir,
         keep_test_dir=args.keep,
         verbose=args.verbose,
+        use_cache=args.cache,
+        parallel=not args.no_parallel,
     )
 
     success = tester.run(test_options, generate_report=not args.no_report)
@@ -216,12 +216,9 @@ impl<T: Clone + Send + Sync + Serialize + for<'de> Deserialize<'de>> Channel<Vec
     }
 
     fn memory_usage(&self) -> usize {
-        std::mem::size_of::<Self>()
-            + self
-                .values
-                .iter()
-                .map(|v| std::mem::size_of_val(v))
-                .sum::<usize>()
+        // Every element has the same size, so this is O(1) rather than a walk
+        // over the queue
+        std::mem::size_of::<Self>() + self.values.len() * std::mem::size_of::<T>()
     }
 }
 
@@ -298,7 +295,10 @@ mod tests {
         // Update with values
         assert!(channel.update(vec![1, 2, 3]).unwrap());
         assert!(channel.is_available());
-        assert!(channel.memory_usage() > initial_memory);
+        assert_eq!(
+            channel.memory_usage(),
+            initial_memory + 3 * std::mem::size_of::<i32>()
+        );
 
         // Test checkpointing
         let checkpoint = channel.checkpoint().unwrap();
@@ -112,8 +112,63 @@ impl RustSQLiteCheckpointer {
             step,
         };
 
+        // Serialization, compression and the write are pure Rust: release the
+        // GIL so other Python threads keep running during the I/O
+        py.allow_threads(|| self.store(&thread_id, &checkpoint_id, &checkpoint_data))?;
+
+        Ok(true)
+    }
+
+    /// Load a checkpoint
+    fn get(
+        &self,
+        py: Python,
+        thread_id: String,
+        checkpoint_id: String,
+    ) -> PyResult<Option<PyObject>> {
+        // Read, decompress and deserialize without holding the GIL; only the
+        // conversion back to Python objects needs it
+        match py.allow_threads(|| self.load(&thread_id, &checkpoint_id))? {
+            Some(checkpoint_data) => {
+                let result = self.checkpoint_data_to_py(py, &checkpoint_data)?;
+                Ok(Some(result))
+            }
+            None => Ok(None),
+        }
+    }
+
+    /// List all checkpoint IDs for a thread
+    fn list_checkpoints(&self, py: Python, thread_id: String) -> PyResult<Vec<String>> {
+        py.allow_threads(|| self.query_checkpoint_ids(&thread_id))
+    }
+
+    /// Delete a checkpoint
+    fn delete(&self, py: Python, thread_id: String, checkpoint_id: String) -> PyResult<bool> {
+        py.allow_threads(|| self.delete_checkpoint(&thread_id, &checkpoint_id))
+    }
+
+    /// Clear all checkpoints for a thread
+    fn clear_thread(&self, py: Python, thread_id: String) -> PyResult<bool> {
+        py.allow_threads(|| self.delete_thread(&thread_id))
+    }
+
+    /// Get statistics about stored checkpoints
+    fn stats(&self, py: Python) -> PyResult<HashMap<String, usize>> {
+        py.allow_threads(|| self.query_stats())
+    }
+}
+
+#[cfg(feature = "sqlite")]
+impl RustSQLiteCheckpointer {
+    /// Serialize, compress and write a checkpoint. Does not touch Python objects.
+    fn store(
+        &self,
+        thread_id: &str,
+        checkpoint_id: &str,
+        checkpoint_data: &CheckpointData,
+    ) -> PyResult<()> {
         // Serialize using MessagePack
-        let serialized = rmp_serde::to_vec(&checkpoint_data).map_err(|e| {
+        let serialized = rmp_serde::to_vec(checkpoint_data).map_err(|e| {
             pyo3::exceptions::PyValueError::new_err(format!("Serialization error: {}", e))
         })?;
 
@@ -131,16 +186,11 @@ impl RustSQLiteCheckpointer {
         )
         .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Insert error: {}", e)))?;
 
-        Ok(true)
+        Ok(())
     }
 
-    /// Load a checkpoint
-    fn get(
-        &self,
-        py: Python,
-        thread_id: String,
-        checkpoint_id: String,
-    ) -> PyResult<Option<PyObject>> {
+    /// Read, decompress and deserialize a checkpoint. Does not touch Python objects.
+    fn load(&self, thread_id: &str, checkpoint_id: &str) -> PyResult<Option<CheckpointData>> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
 
@@ -164,9 +214,7 @@ impl RustSQLiteCheckpointer {
                         ))
                     })?;
 
-                // Convert back to Python dict
-                let result = self.checkpoint_data_to_py(py, &checkpoint_data)?;
-                Ok(Some(result))
+                Ok(Some(checkpoint_data))
             }
             Err(rusqlite::Error::QueryReturnedNoRows) => Ok(None),
             Err(e) => Err(pyo3::exceptions::PyIOError::new_err(format!(
@@ -176,8 +224,7 @@ impl RustSQLiteCheckpointer {
         }
     }
 
-    /// List all checkpoint IDs for a thread
-    fn list_checkpoints(&self, thread_id: String) -> PyResult<Vec<String>> {
+    fn query_checkpoint_ids(&self, thread_id: &str) -> PyResult<Vec<String>> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
 
@@ -194,8 +241,7 @@ impl RustSQLiteCheckpointer {
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Collection error: {}", e)))
     }
 
-    /// Delete a checkpoint
-    fn delete(&self, thread_id: String, checkpoint_id: String) -> PyResult<bool> {
+    fn delete_checkpoint(&self, thread_id: &str, checkpoint_id: &str) -> PyResult<bool> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
 
@@ -209,8 +255,7 @@ impl RustSQLiteCheckpointer {
         Ok(rows > 0)
     }
 
-    /// Clear all checkpoints for a thread
-    fn clear_thread(&self, thread_id: String) -> PyResult<bool> {
+    fn delete_thread(&self, thread_id: &str) -> PyResult<bool> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
 
@@ -224,8 +269,7 @@ impl RustSQLiteCheckpointer {
         Ok(rows > 0)
     }
 
-    /// Get statistics about stored checkpoints
-    fn stats(&self) -> PyResult<HashMap<String, usize>> {
+    fn query_stats(&self) -> PyResult<HashMap<String, usize>> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
 
@@ -258,10 +302,7 @@ impl RustSQLiteCheckpointer {
 
         Ok(stats)
     }
-}
 
-#[cfg(feature = "sqlite")]
-impl RustSQLiteCheckpointer {
     fn init_db(&self) -> PyResult<()> {
         let conn = Connection::open(&self.db_path)
             .map_err(|e| pyo3::exceptions::PyIOError::new_err(format!("Database error: {}", e)))?;
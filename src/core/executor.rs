@@ -8,6 +8,32 @@ use super::node::Node;
 use super::state::GraphState;
 use pyo3::prelude::*;
 use std::collections::{HashMap, HashSet};
+use std::sync::OnceLock;
+
+/// Runtime shared by every PregelCore, created on first use
+static RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+
+/// Get the process-wide tokio runtime used for synchronous invocation
+///
+/// Building a multi-threaded runtime spawns a worker pool, so doing it per
+/// call (or per graph) multiplies threads under concurrent workloads.
+fn shared_runtime() -> PyResult<&'static tokio::runtime::Runtime> {
+    if let Some(rt) = RUNTIME.get() {
+        return Ok(rt);
+    }
+
+    let rt = tokio::runtime::Builder::new_multi_thread()
+        .worker_threads(num_cpus::get())
+        .thread_name("fast-langgraph-worker")
+        .enable_all()
+        .build()
+        .map_err(|e| {
+            pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to create runtime: {}", e))
+        })?;
+
+    // Another thread may have won the race; its runtime is kept and ours dropped
+    Ok(RUNTIME.get_or_init(|| rt))
+}
 
 /// PregelCore is the main execution engine for LangGraph
 ///
@@ -102,12 +128,8 @@ impl PregelCore {
 
     /// Synchronous invoke wrapper
     pub fn invoke(&mut self, py: Python<'_>, input: PyObject) -> PyResult<PyObject> {
-        // Use tokio runtime for async execution
-        let rt = tokio::runtime::Runtime::new().map_err(|e| {
-            pyo3::exceptions::PyRuntimeError::new_err(format!("Failed to create runtime: {}", e))
-        })?;
-
-        rt.block_on(self.invoke_async(py, input))
+        // Use the shared tokio runtime for async execution
+        shared_runtime()?.block_on(self.invoke_async(py, input))
     }
 
     /// Get the starting node for execution
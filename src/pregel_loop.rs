@@ -324,7 +324,7 @@ impl PregelLoop {
     }
 
     /// Initialize channels with input data
-    fn initialize_input(&mut self, py: Python, input: PyObject) -> PyResult<()> {
+    pub fn initialize_input(&mut self, py: Python, input: PyObject) -> PyResult<()> {
         // Determine which channels to write input to
         // For now, write to all channels that exist
         if input.as_ref(py).is_instance_of::<PyDict>() {
@@ -377,38 +377,45 @@ impl PregelLoop {
         self.initialize_input(py, input)?;
 
         // Execute supersteps until convergence or limit
-        while self.step < self.config.recursion_limit {
-            // Execute one superstep
-            let task_writes = self.execute_step(py)?;
-
-            if task_writes.is_empty() {
-                // No more tasks - reached convergence
-                break;
-            }
-
-            // Apply writes to channels
-            apply_writes(
-                py,
-                &mut self.checkpoint.channel_versions,
-                &mut self.checkpoint.versions_seen,
-                &mut self.channels,
-                &task_writes,
-            )?;
-
-            // Yield current state
-            let current_state = self.get_current_state(py)?;
+        while let Some(current_state) = self.step_once(py)? {
             results.push(current_state);
-
-            self.step += 1;
         }
 
+        Ok(results)
+    }
+
+    /// Execute a single superstep and return the resulting state
+    ///
+    /// Returns None once no tasks remain (convergence), and a RecursionError
+    /// when the recursion limit is reached first.
+    pub fn step_once(&mut self, py: Python) -> PyResult<Option<PyObject>> {
         if self.step >= self.config.recursion_limit {
             return Err(PyErr::new::<pyo3::exceptions::PyRecursionError, _>(
                 format!("Recursion limit of {} reached", self.config.recursion_limit),
             ));
         }
 
-        Ok(results)
+        // Execute one superstep
+        let task_writes = self.execute_step(py)?;
+
+        if task_writes.is_empty() {
+            // No more tasks - reached convergence
+            return Ok(None);
+        }
+
+        // Apply writes to channels
+        apply_writes(
+            py,
+            &mut self.checkpoint.channel_versions,
+            &mut self.checkpoint.versions_seen,
+            &mut self.channels,
+            &task_writes,
+        )?;
+
+        let current_state = self.get_current_state(py)?;
+        self.step += 1;
+
+        Ok(Some(current_state))
     }
 
     /// Get the current checkpoint
@@ -1,4 +1,5 @@
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::{PyDict, PyList, PyTuple, PyType};
 use std::collections::HashMap;
 
@@ -137,6 +138,26 @@ impl BaseChannel {
     }
 }
 
+static EMPTY_CHANNEL_ERROR: GILOnceCell<PyObject> = GILOnceCell::new();
+static INVALID_UPDATE_ERROR: GILOnceCell<PyObject> = GILOnceCell::new();
+
+/// Look up a LangGraph exception class, caching it after the first success
+///
+/// Failed lookups are not cached, so the fallback error is used only while
+/// LangGraph cannot be imported.
+fn langgraph_exception<'py>(
+    py: Python<'py>,
+    cell: &'static GILOnceCell<PyObject>,
+    module: &str,
+    name: &str,
+) -> PyResult<&'py PyAny> {
+    if let Some(exc_class) = cell.get(py) {
+        return Ok(exc_class.as_ref(py));
+    }
+    let exc_class: PyObject = py.import(module)?.getattr(name)?.into();
+    Ok(cell.get_or_init(py, || exc_class).as_ref(py))
+}
+
 /// LastValue channel stores the last value received
 #[pyclass]
 pub struct LastValue {
@@ -167,12 +188,15 @@ impl LastValue {
 
         if values.len() != 1 {
             // Raise InvalidUpdateError from langgraph.errors
-            let result = py
-                .import("langgraph.errors")
-                .and_then(|m| m.getattr("InvalidUpdateError"))
-                .and_then(|exc_class| exc_class.call1((
-                    "At key '': Can receive only one value per step. Use an Annotated key to handle multiple values.\nFor troubleshooting, visit: https://docs.langchain.com/oss/python/langgraph/errors/INVALID_CONCURRENT_GRAPH_UPDATE",
-                )));
+            let result = langgraph_exception(
+                py,
+                &INVALID_UPDATE_ERROR,
+                "langgraph.errors",
+                "InvalidUpdateError",
+            )
+            .and_then(|exc_class| exc_class.call1((
+                "At key '': Can receive only one value per step. Use an Annotated key to handle multiple values.\nFor troubleshooting, visit: https://docs.langchain.com/oss/python/langgraph/errors/INVALID_CONCURRENT_GRAPH_UPDATE",
+            )));
 
             match result {
                 Ok(exc) => return Err(pyo3::PyErr::from_value(exc)),
@@ -188,16 +212,32 @@ impl LastValue {
         Ok(true)
     }
 
+    /// Apply a sequence of single-value updates in one call
+    ///
+    /// Equivalent to calling `update([value])` for each value in order, but
+    /// crosses the Python/Rust boundary once. Only the last value is kept.
+    fn update_many(&mut self, values: &PyList) -> PyResult<bool> {
+        if values.is_empty() {
+            return Ok(false);
+        }
+
+        self.value = Some(values.get_item(values.len() - 1)?.into());
+        Ok(true)
+    }
+
     /// Get the current value
     fn get(&self, py: Python) -> PyResult<PyObject> {
         match &self.value {
             Some(value) => Ok(value.clone_ref(py)),
             None => {
                 // Raise EmptyChannelError from LangGraph
-                let result = py
-                    .import("langgraph.checkpoint.base")
-                    .and_then(|m| m.getattr("EmptyChannelError"))
-                    .and_then(|exc_class| exc_class.call0());
+                let result = langgraph_exception(
+                    py,
+                    &EMPTY_CHANNEL_ERROR,
+                    "langgraph.checkpoint.base",
+                    "EmptyChannelError",
+                )
+                .and_then(|exc_class| exc_class.call0());
 
                 match result {
                     Ok(exc) => Err(pyo3::PyErr::from_value(exc)),
@@ -306,6 +346,31 @@ impl LastValue {
     }
 }
 
+/// JSON encoder/decoder used by Checkpoint serialization
+struct JsonCodec {
+    dumps: PyObject,
+    loads: PyObject,
+    /// orjson.dumps returns bytes, json.dumps returns str
+    returns_bytes: bool,
+}
+
+static JSON_CODEC: GILOnceCell<JsonCodec> = GILOnceCell::new();
+
+/// Resolve the JSON codec once: orjson when installed, the stdlib json otherwise
+fn json_codec(py: Python) -> PyResult<&'static JsonCodec> {
+    JSON_CODEC.get_or_try_init(py, || {
+        let (module, returns_bytes) = match py.import("orjson") {
+            Ok(module) => (module, true),
+            Err(_) => (py.import("json")?, false),
+        };
+        Ok(JsonCodec {
+            dumps: module.getattr("dumps")?.into(),
+            loads: module.getattr("loads")?.into(),
+            returns_bytes,
+        })
+    })
+}
+
 /// Checkpoint represents a state snapshot at a given point in time
 /// Must match LangGraph's Checkpoint TypedDict structure exactly
 #[pyclass(dict, mapping)]
@@ -360,23 +425,62 @@ impl Checkpoint {
     }
 
     /// Serialize the checkpoint to JSON
-    fn to_json(&self, _py: Python) -> PyResult<String> {
-        // In a real implementation, this would serialize the checkpoint to JSON
-        // For now, we'll return a simple JSON representation
-        Ok(format!(
-            r#"{{"v": {}, "id": "{}", "ts": "{}"}}"#,
-            self.v, self.id, self.ts
-        ))
+    fn to_json(&self, py: Python) -> PyResult<String> {
+        let data = PyDict::new(py);
+        data.set_item("v", self.v)?;
+        data.set_item("id", &self.id)?;
+        data.set_item("ts", &self.ts)?;
+        data.set_item("channel_values", &self.channel_values)?;
+        data.set_item("channel_versions", &self.channel_versions)?;
+        data.set_item("versions_seen", &self.versions_seen)?;
+        data.set_item("pending_sends", &self.pending_sends)?;
+        data.set_item("current_tasks", &self.current_tasks)?;
+
+        let codec = json_codec(py)?;
+        let encoded = codec.dumps.call1(py, (data,))?;
+        if codec.returns_bytes {
+            // orjson.dumps returns UTF-8 encoded bytes
+            encoded.call_method0(py, "decode")?.extract(py)
+        } else {
+            encoded.extract(py)
+        }
     }
 
     /// Deserialize a checkpoint from JSON
     #[classmethod]
-    fn from_json(_cls: &PyType, py: Python, _json_str: &str) -> PyResult<Py<Self>> {
-        // In a real implementation, this would deserialize from JSON
-        // For now, we'll create a simple checkpoint
+    fn from_json(_cls: &PyType, py: Python, json_str: &str) -> PyResult<Py<Self>> {
+        let decoded = json_codec(py)?.loads.call1(py, (json_str,))?;
+        let data: &PyDict = decoded.as_ref(py).downcast()?;
+        let field = |key: &str| -> PyResult<Option<PyObject>> {
+            Ok(data.get_item(key)?.map(|value| value.into()))
+        };
+
+        let v = match data.get_item("v")? {
+            Some(value) => value.extract()?,
+            None => 1,
+        };
+        let id = data
+            .get_item("id")?
+            .map(|value| value.extract())
+            .transpose()?;
+        let ts = data
+            .get_item("ts")?
+            .map(|value| value.extract())
+            .transpose()?;
+
         Py::new(
             py,
-            Checkpoint::new(py, 1, None, None, None, None, None, None, None)?,
+            Checkpoint::new(
+                py,
+                v,
+                id,
+                ts,
+                field("channel_values")?,
+                field("channel_versions")?,
+                field("versions_seen")?,
+                field("pending_sends")?,
+                field("current_tasks")?,
+            )?,
         )
     }
 
@@ -466,6 +570,101 @@ fn extract_pregel_node(py: Python, node_name: &str, node_obj: &PyObject) -> PyRe
     })
 }
 
+/// Format a state dict based on a Pregel's output_channels configuration
+fn format_output(
+    py: Python,
+    output_channels: Option<&PyObject>,
+    state: PyObject,
+) -> PyResult<PyObject> {
+    // Output formatting rules (in order of precedence):
+    // 1. output_channels as list → return dict with those keys
+    // 2. output_channels as string → return raw value from that key
+    // 3. output_channels None/empty → return None
+    // 4. No output_channels → return full state
+
+    if let Some(output_channels) = output_channels {
+        // Check if it's Python None
+        if output_channels.as_ref(py).is_none() {
+            return Ok(py.None());
+        }
+
+        // Try to extract as list (Rule 1)
+        if let Ok(channels_list) = output_channels.extract::<Vec<String>>(py) {
+            if channels_list.is_empty() {
+                return Ok(py.None());
+            }
+            // Non-empty list → return dict with those keys
+            let result_dict = PyDict::new(py);
+            if let Ok(state_dict) = state.downcast::<PyDict>(py) {
+                for channel in channels_list {
+                    if let Some(value) = state_dict.get_item(&channel)? {
+                        result_dict.set_item(&channel, value)?;
+                    }
+                }
+            }
+            return Ok(result_dict.into());
+        }
+
+        // Try to extract as string (Rule 2)
+        if let Ok(channel_str) = output_channels.extract::<String>(py) {
+            if channel_str.is_empty() {
+                return Ok(py.None());
+            }
+            // Non-empty string → return raw value from that key
+            if let Ok(state_dict) = state.downcast::<PyDict>(py) {
+                if let Some(value) = state_dict.get_item(&channel_str)? {
+                    return Ok(value.into());
+                }
+            }
+            return Ok(py.None());
+        }
+    }
+
+    // Rule 4: No output_channels → return full state
+    Ok(state)
+}
+
+/// Iterator returned by Pregel.stream, executing one superstep per item
+///
+/// Each call to `__next__` runs the next superstep in the Rust PregelLoop
+/// and yields the formatted state, so consumers see the first chunk as soon
+/// as it is written instead of after the whole graph has finished.
+#[pyclass]
+pub struct PregelStreamIter {
+    /// Remaining execution, dropped once the stream is exhausted or fails
+    loop_executor: Option<PregelLoop>,
+    output_channels: Option<PyObject>,
+}
+
+#[pymethods]
+impl PregelStreamIter {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&mut self, py: Python) -> PyResult<Option<PyObject>> {
+        let result = match self.loop_executor.as_mut() {
+            Some(loop_executor) => loop_executor.step_once(py),
+            None => return Ok(None),
+        };
+
+        match result {
+            Ok(Some(state)) => format_output(py, self.output_channels.as_ref(), state).map(Some),
+            Ok(None) => {
+                self.loop_executor = None;
+                Ok(None)
+            }
+            Err(e) => {
+                self.loop_executor = None;
+                Err(e)
+            }
+        }
+    }
+}
+
+/// Default superstep limit, matching LangGraph's recursion_limit default
+const DEFAULT_RECURSION_LIMIT: usize = 25;
+
 /// Pregel provides the main execution engine for LangGraph
 #[pyclass(subclass)]
 pub struct Pregel {
@@ -1189,6 +1388,27 @@ MockSchema
         Ok(py.None())
     }
 
+    /// Run the graph to completion in a single call
+    ///
+    /// The whole superstep loop (trigger selection, node execution and
+    /// channel writes) runs inside the Rust PregelLoop for at most
+    /// `max_steps` supersteps or until an interrupt fires; only the user's
+    /// node callables and the final output cross back into Python.
+    #[pyo3(signature = (input, max_steps=DEFAULT_RECURSION_LIMIT, *, interrupt_before=None, interrupt_after=None))]
+    fn run_until(
+        &self,
+        py: Python,
+        input: PyObject,
+        max_steps: usize,
+        interrupt_before: Option<PyObject>,
+        interrupt_after: Option<PyObject>,
+    ) -> PyResult<PyObject> {
+        let mut loop_executor =
+            self.build_rust_loop(py, max_steps, interrupt_before, interrupt_after)?;
+        let result = loop_executor.invoke(py, input)?;
+        self.format_output(py, result)
+    }
+
     /// Internal: Invoke using Rust PregelLoop
     fn invoke_with_rust_loop(
         &self,
@@ -1197,87 +1417,22 @@ MockSchema
         interrupt_before: Option<PyObject>,
         interrupt_after: Option<PyObject>,
     ) -> PyResult<PyObject> {
-        // 1. Convert Python nodes to PregelNode structures
-        let mut pregel_nodes = HashMap::new();
-        for (node_name, node_obj) in &self.nodes {
-            let pregel_node = extract_pregel_node(py, node_name, node_obj)?;
-            pregel_nodes.insert(node_name.clone(), pregel_node);
-        }
-
-        // 2. Extract interrupt configuration
-        let interrupt_before_list = interrupt_before
-            .and_then(|v| v.extract::<Vec<String>>(py).ok())
-            .unwrap_or_default();
-
-        let interrupt_after_list = interrupt_after
-            .and_then(|v| v.extract::<Vec<String>>(py).ok())
-            .unwrap_or_default();
-
-        // 3. Create PregelConfig
-        let config = PregelConfig {
-            recursion_limit: 25,
-            interrupt_before: interrupt_before_list,
-            interrupt_after: interrupt_after_list,
-        };
-
-        // 4. Create PregelLoop
-        let mut loop_executor = PregelLoop::new(pregel_nodes, self.channels.clone(), config);
+        let mut loop_executor = self.build_rust_loop(
+            py,
+            DEFAULT_RECURSION_LIMIT,
+            interrupt_before,
+            interrupt_after,
+        )?;
 
-        // 5. Execute
         let result = loop_executor.invoke(py, input)?;
 
-        // 6. Format output based on output_channels
+        // Format output based on output_channels
         self.format_output(py, result)
     }
 
     /// Internal: Format output based on output_channels configuration
     fn format_output(&self, py: Python, state: PyObject) -> PyResult<PyObject> {
-        // Output formatting rules (in order of precedence):
-        // 1. output_channels as list → return dict with those keys
-        // 2. output_channels as string → return raw value from that key
-        // 3. output_channels None/empty → return None
-        // 4. No output_channels → return full state
-
-        if let Some(ref output_channels) = self.output_channels {
-            // Check if it's Python None
-            if output_channels.as_ref(py).is_none() {
-                return Ok(py.None());
-            }
-
-            // Try to extract as list (Rule 1)
-            if let Ok(channels_list) = output_channels.extract::<Vec<String>>(py) {
-                if channels_list.is_empty() {
-                    return Ok(py.None());
-                }
-                // Non-empty list → return dict with those keys
-                let result_dict = PyDict::new(py);
-                if let Ok(state_dict) = state.downcast::<PyDict>(py) {
-                    for channel in channels_list {
-                        if let Some(value) = state_dict.get_item(&channel)? {
-                            result_dict.set_item(&channel, value)?;
-                        }
-                    }
-                }
-                return Ok(result_dict.into());
-            }
-
-            // Try to extract as string (Rule 2)
-            if let Ok(channel_str) = output_channels.extract::<String>(py) {
-                if channel_str.is_empty() {
-                    return Ok(py.None());
-                }
-                // Non-empty string → return raw value from that key
-                if let Ok(state_dict) = state.downcast::<PyDict>(py) {
-                    if let Some(value) = state_dict.get_item(&channel_str)? {
-                        return Ok(value.into());
-                    }
-                }
-                return Ok(py.None());
-            }
-        }
-
-        // Rule 4: No output_channels → return full state
-        Ok(state)
+        format_output(py, self.output_channels.as_ref(), state)
     }
 
     /// Internal: Stream using Rust PregelLoop
@@ -1288,14 +1443,45 @@ MockSchema
         interrupt_before: Option<PyObject>,
         interrupt_after: Option<PyObject>,
     ) -> PyResult<PyObject> {
-        // 1. Convert Python nodes to PregelNode structures
+        let mut loop_executor = self.build_rust_loop(
+            py,
+            DEFAULT_RECURSION_LIMIT,
+            interrupt_before,
+            interrupt_after,
+        )?;
+
+        // Write the input now so invalid input fails at the call site;
+        // supersteps run lazily as the iterator is consumed
+        loop_executor.initialize_input(py, input)?;
+
+        let stream = PregelStreamIter {
+            loop_executor: Some(loop_executor),
+            output_channels: self
+                .output_channels
+                .as_ref()
+                .map(|channels| channels.clone_ref(py)),
+        };
+        Ok(Py::new(py, stream)?.into_py(py))
+    }
+}
+
+impl Pregel {
+    /// Build a PregelLoop over this graph's nodes and channels
+    fn build_rust_loop(
+        &self,
+        py: Python,
+        recursion_limit: usize,
+        interrupt_before: Option<PyObject>,
+        interrupt_after: Option<PyObject>,
+    ) -> PyResult<PregelLoop> {
+        // Convert Python nodes to PregelNode structures
         let mut pregel_nodes = HashMap::new();
         for (node_name, node_obj) in &self.nodes {
             let pregel_node = extract_pregel_node(py, node_name, node_obj)?;
             pregel_nodes.insert(node_name.clone(), pregel_node);
         }
 
-        // 2. Extract interrupt configuration
+        // Extract interrupt configuration
         let interrupt_before_list = interrupt_before
             .and_then(|v| v.extract::<Vec<String>>(py).ok())
             .unwrap_or_default();
@@ -1304,27 +1490,13 @@ MockSchema
             .and_then(|v| v.extract::<Vec<String>>(py).ok())
             .unwrap_or_default();
 
-        // 3. Create PregelConfig
         let config = PregelConfig {
-            recursion_limit: 25,
+            recursion_limit,
             interrupt_before: interrupt_before_list,
             interrupt_after: interrupt_after_list,
         };
 
-        // 4. Create PregelLoop
-        let mut loop_executor = PregelLoop::new(pregel_nodes, self.channels.clone(), config);
-
-        // 5. Execute with streaming
-        let results = loop_executor.stream(py, input)?;
-
-        // 6. Format each result and return as list
-        let formatted_results = PyList::empty(py);
-        for result in results {
-            let formatted = self.format_output(py, result)?;
-            formatted_results.append(formatted)?;
-        }
-
-        Ok(formatted_results.into())
+        Ok(PregelLoop::new(pregel_nodes, self.channels.clone(), config))
     }
 }
 
@@ -1335,6 +1507,7 @@ fn fast_langgraph(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<LastValue>()?;
     m.add_class::<Checkpoint>()?;
     m.add_class::<Pregel>()?;
+    m.add_class::<PregelStreamIter>()?;
     m.add_class::<GraphExecutor>()?;
     m.add_class::<OutputConfig>()?;
 
@@ -26,12 +26,13 @@ def benchmark_channels():
         # Create channel
         channel = fast_langgraph.LastValue(str, "benchmark_channel")
 
-        # Benchmark updates
-        start_time = time.perf_counter_ns()
+        # Benchmark updates (inputs built outside the timed region)
         iterations = 10000
+        updates = [[f"value_{i}"] for i in range(iterations)]
+        start_time = time.perf_counter_ns()
 
-        for i in range(iterations):
-            channel.update([f"value_{i}"])
+        for update in updates:
+            channel.update(update)
 
         end_time = time.perf_counter_ns()
         avg_update_time = (end_time - start_time) / iterations
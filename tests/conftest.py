@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the Fast LangGraph test suite
+"""
+
+import os
+import sys
+
+import pytest
+
+# Make the in-tree package importable when pytest is run without installing it
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# pytester runs the pytest plugin in test_pytest_plugin.py
+pytest_plugins = ["pytester"]
+
+
+@pytest.fixture(scope="session")
+def shim():
+    """The fast_langgraph.shim module, imported once per session"""
+    import fast_langgraph.shim
+
+    return fast_langgraph.shim
+
+
+@pytest.fixture(scope="session")
+def rust_available():
+    """Whether the Rust extension can be loaded, checked once per session"""
+    import fast_langgraph
+
+    return fast_langgraph.is_rust_available()
@@ -0,0 +1,45 @@
+"""
+Tests for the LangGraph compatibility runner in scripts/test_compatibility.py
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+import test_compatibility  # noqa: E402
+
+
+@pytest.fixture
+def tester(tmp_path):
+    """A CompatibilityTester working in a throwaway directory"""
+    return test_compatibility.CompatibilityTester(test_dir=tmp_path, parallel=False)
+
+
+def test_pytest_options_keep_repeated_flags(tester):
+    options = tester._pytest_options(["-o", "a=1", "-o", "b=2"])
+
+    assert options[:4] == ["-o", "a=1", "-o", "b=2"]
+    for ignore in tester._REQUIRED_IGNORES:
+        assert options.count(ignore) == 1
+
+
+def test_pytest_options_skip_required_ignores_already_given(tester):
+    ignore = tester._REQUIRED_IGNORES[0]
+    options = tester._pytest_options(["-x", ignore])
+
+    assert options[:2] == ["-x", ignore]
+    assert options.count(ignore) == 1
+
+
+def test_maturin_env_leaves_rustflags_without_cache_target(tester, monkeypatch):
+    monkeypatch.setenv("RUSTFLAGS", "-C debuginfo=0")
+
+    assert tester.maturin_env()["RUSTFLAGS"] == "-C debuginfo=0"
+
+    tester.cargo_target_dir = tester.test_dir / "target"
+    env = tester.maturin_env()
+    assert env["RUSTFLAGS"] == "-C debuginfo=0 -C target-cpu=native"
+    assert env["CARGO_TARGET_DIR"] == str(tester.test_dir / "target")
@@ -5,9 +5,11 @@ These tests verify that the Rust implementations are compatible with the
 original LangGraph Python API.
 """
 
+import json
 import os
 import sys
 import time
+import timeit
 
 import pytest
 
@@ -22,6 +24,57 @@ except ImportError:
     RUST_AVAILABLE = False
 
 
+def _average_ns(stmt, **names):
+    """Average time of one `stmt` call in ns, calibrated by timeit.autorange()
+
+    Callables and inputs are passed in as names so the timed statement does
+    no attribute lookups or allocations of its own.
+    """
+    number, total = timeit.Timer(stmt, globals=names).autorange()
+    return total / number * 1e9
+
+
+class _Node:
+    """Minimal node for the Rust PregelLoop: trigger/output channels and a callable"""
+
+    def __init__(self, fn, triggers, channels):
+        self.fn = fn
+        self.triggers = triggers
+        self.channels = channels
+
+    def __call__(self, _input):
+        return self.fn()
+
+
+class _RejectingChannel:
+    """Channel whose update always fails, standing in for invalid input"""
+
+    def update(self, values):
+        raise ValueError(f"rejected {values!r}")
+
+    def get(self):
+        raise ValueError("empty")
+
+
+def _doubling_graph():
+    """One-node graph writing twice the "input" channel to "output"
+
+    Returns the Pregel and the list of node runs.
+    """
+    calls = []
+    channels = {
+        "input": fast_langgraph.LastValue(int, "input"),
+        "output": fast_langgraph.LastValue(int, "output"),
+    }
+
+    def double():
+        calls.append("double")
+        return channels["input"].get() * 2
+
+    node = _Node(double, triggers=["input"], channels=["output"])
+    return fast_langgraph.Pregel(nodes={"double": node}, channels=channels), calls
+
+
 class TestDirectUsage:
     """Test direct usage of Rust implementations."""
 
@@ -49,6 +102,17 @@ class TestDirectUsage:
         value = channel.get()
         assert value == "test_value"
 
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_last_value_channel_update_many(self):
+        """Test applying several updates to a LastValue channel in one call."""
+        channel = fast_langgraph.LastValue(str, "test")
+
+        assert channel.update_many([]) is False
+        assert not channel.is_available()
+
+        assert channel.update_many(["first", "second", "last"]) is True
+        assert channel.get() == "last"
+
     @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
     def test_checkpoint_creation(self):
         """Test creating a checkpoint."""
@@ -62,12 +126,27 @@ class TestDirectUsage:
         checkpoint = fast_langgraph.Checkpoint()
         json_str = checkpoint.to_json()
         assert isinstance(json_str, str)
-        assert '"v": 1' in json_str
+        assert json.loads(json_str)["v"] == 1
 
         # Test deserialization
         new_checkpoint = fast_langgraph.Checkpoint.from_json(json_str)
         assert new_checkpoint.v == checkpoint.v
 
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_checkpoint_serialization_round_trip(self):
+        """Test that channel state survives a JSON round trip."""
+        checkpoint = fast_langgraph.Checkpoint(
+            id="checkpoint-1",
+            channel_values={"messages": ["hello"]},
+            channel_versions={"messages": 2},
+            versions_seen={"node": {"messages": 1}},
+        )
+        restored = fast_langgraph.Checkpoint.from_json(checkpoint.to_json())
+        assert restored.id == "checkpoint-1"
+        assert restored.channel_values == {"messages": ["hello"]}
+        assert restored.channel_versions == {"messages": 2}
+        assert restored.versions_seen == {"node": {"messages": 1}}
+
     @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
     def test_pregel_creation(self):
         """Test creating a Pregel instance."""
@@ -75,6 +154,74 @@ class TestDirectUsage:
         pregel = fast_langgraph.Pregel(nodes={}, output_channels=[], input_channels=[])
         assert pregel is not None
 
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_pregel_run_until(self):
+        """Test running a one-node graph to completion with run_until."""
+        pregel, calls = _doubling_graph()
+
+        assert pregel.run_until({"input": 3}) == {"input": 3, "output": 6}
+        assert calls == ["double"]
+
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_pregel_run_until_max_steps(self):
+        """Test that run_until stops a non-converging graph after max_steps."""
+        count = fast_langgraph.LastValue(int, "count")
+        tick = _Node(lambda: count.get() + 1, triggers=["count"], channels=["count"])
+        pregel = fast_langgraph.Pregel(nodes={"tick": tick}, channels={"count": count})
+
+        with pytest.raises(RecursionError):
+            pregel.run_until({"count": 0}, max_steps=3)
+        assert count.get() == 3
+
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_pregel_run_until_interrupt_before(self):
+        """Test that run_until returns the state before an interrupted node."""
+        pregel, calls = _doubling_graph()
+
+        result = pregel.run_until({"input": 3}, interrupt_before=["double"])
+
+        assert result == {"input": 3}
+        assert calls == []
+
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_pregel_stream_yields_each_superstep(self):
+        """Test that stream returns an iterator with one state per superstep."""
+        channels = {
+            name: fast_langgraph.LastValue(int, name)
+            for name in ("input", "mid", "output")
+        }
+        nodes = {
+            "a": _Node(
+                lambda: channels["input"].get() + 1,
+                triggers=["input"],
+                channels=["mid"],
+            ),
+            "b": _Node(
+                lambda: channels["mid"].get() * 2, triggers=["mid"], channels=["output"]
+            ),
+        }
+        pregel = fast_langgraph.Pregel(
+            nodes=nodes, channels=channels, output_channels=["mid", "output"]
+        )
+
+        stream = pregel.stream({"input": 1})
+
+        assert iter(stream) is stream
+        assert next(stream) == {"mid": 2}
+        assert next(stream) == {"mid": 2, "output": 4}
+        with pytest.raises(StopIteration):
+            next(stream)
+
+    @pytest.mark.skipif(not RUST_AVAILABLE, reason="Rust extension not available")
+    def test_pregel_stream_rejects_input_at_call_site(self):
+        """Test that stream raises for invalid input before it is iterated."""
+        pregel, calls = _doubling_graph()
+        pregel.channels = {**pregel.channels, "input": _RejectingChannel()}
+
+        with pytest.raises(ValueError, match="rejected"):
+            pregel.stream({"input": 3})
+        assert calls == []
+
 
 class TestShimModule:
     """Test the shim module functionality."""
@@ -121,15 +268,18 @@ class TestPerformance:
 
         channel = fast_langgraph.LastValue(int, "perf_test")
 
+        # Build the inputs outside the timed region
+        updates = [[i] for i in range(10000)]
+
         # Warm up
-        for i in range(100):
-            channel.update([i])
+        for update in updates[:100]:
+            channel.update(update)
 
         # Time the operations
-        start_time = time.time()
-        for i in range(10000):
-            channel.update([i])
-        end_time = time.time()
+        start_time = time.perf_counter()
+        for update in updates:
+            channel.update(update)
+        end_time = time.perf_counter()
 
         duration = end_time - start_time
         ops_per_second = 10000 / duration
@@ -170,172 +320,145 @@ class TestPerformance:
 
 def test_rust_channel_performance():
     """Test that demonstrates the performance improvements of Rust channels."""
-    try:
-        # Import the Rust implementation if available
-        import fast_langgraph
-        from fast_langgraph import LastValueChannel
-
-        # Test LastValueChannel performance
-        channel = LastValueChannel(str)
+    # Skip unless the Rust implementation is available
+    pytest.importorskip("fast_langgraph.fast_langgraph")
+    from fast_langgraph import LastValueChannel
 
-        # Measure update performance
-        start_time = time.perf_counter_ns()
-        for i in range(1000):
-            channel.update([f"value_{i}"])
-        end_time = time.perf_counter_ns()
+    # Test LastValueChannel performance
+    channel = LastValueChannel(str)
 
-        avg_update_time = (end_time - start_time) / 1000
-        print(f"Average LastValueChannel update time: {avg_update_time:.2f}ns")
+    # Measure update performance
+    avg_update_time = _average_ns(
+        "update(values)", update=channel.update, values=["value"]
+    )
+    print(f"Average LastValueChannel update time: {avg_update_time:.2f}ns")
 
-        # Should be significantly faster than Python implementation
-        assert avg_update_time < 1000  # Less than 1 microsecond average
+    # Should be significantly faster than Python implementation
+    assert avg_update_time < 1000  # Less than 1 microsecond average
 
-        # Test get performance
-        start_time = time.perf_counter_ns()
-        for i in range(1000):
-            value = channel.get()
-        end_time = time.perf_counter_ns()
+    # Batched updates cross the FFI boundary once per batch
+    values = [f"value_{i}" for i in range(1000)]
+    avg_batched_time = _average_ns(
+        "update_many(values)", update_many=channel.update_many, values=values
+    ) / len(values)
+    print(f"Average LastValueChannel batched update time: {avg_batched_time:.2f}ns")
+    assert avg_batched_time < avg_update_time
+    assert channel.get() == "value_999"
 
-        avg_get_time = (end_time - start_time) / 1000
-        print(f"Average LastValueChannel get time: {avg_get_time:.2f}ns")
+    # Test get performance
+    avg_get_time = _average_ns("get()", get=channel.get)
+    print(f"Average LastValueChannel get time: {avg_get_time:.2f}ns")
 
-        # Should be significantly faster than Python implementation
-        assert avg_get_time < 500  # Less than 500ns average
-
-    except ImportError:
-        # Fall back to Python implementation if Rust is not available
-        pytest.skip("Rust implementation not available")
+    # Should be significantly faster than Python implementation
+    assert avg_get_time < 500  # Less than 500ns average
 
 
 def test_rust_checkpoint_performance():
     """Test that demonstrates the performance improvements of Rust checkpoints."""
-    try:
-        # Import the Rust implementation if available
-        from fast_langgraph.checkpoint import Checkpoint
-
-        # Test checkpoint creation performance
-        start_time = time.perf_counter_ns()
-        for i in range(100):
-            checkpoint = Checkpoint()
-            checkpoint.channel_values["test"] = f"value_{i}"
-        end_time = time.perf_counter_ns()
-
-        avg_creation_time = (end_time - start_time) / 100
-        print(f"Average Checkpoint creation time: {avg_creation_time:.2f}ns")
+    # Skip unless the Rust implementation is available
+    Checkpoint = pytest.importorskip("fast_langgraph.checkpoint").Checkpoint
 
-        # Should be significantly faster than Python implementation
-        assert avg_creation_time < 10000  # Less than 10 microseconds average
-
-        # Test JSON serialization performance
+    # Test checkpoint creation performance
+    values = [f"value_{i}" for i in range(100)]
+    start_time = time.perf_counter_ns()
+    for value in values:
         checkpoint = Checkpoint()
-        checkpoint.channel_values["test"] = "test_value"
+        checkpoint.channel_values["test"] = value
+    end_time = time.perf_counter_ns()
 
-        start_time = time.perf_counter_ns()
-        for i in range(100):
-            json_str = checkpoint.to_json()
-        end_time = time.perf_counter_ns()
+    avg_creation_time = (end_time - start_time) / 100
+    print(f"Average Checkpoint creation time: {avg_creation_time:.2f}ns")
 
-        avg_serialization_time = (end_time - start_time) / 100
-        print(f"Average JSON serialization time: {avg_serialization_time:.2f}ns")
+    # Should be significantly faster than Python implementation
+    assert avg_creation_time < 10000  # Less than 10 microseconds average
 
-        # Should be significantly faster than Python implementation
-        assert avg_serialization_time < 5000  # Less than 5 microseconds average
+    # Test JSON serialization performance
+    checkpoint = Checkpoint()
+    checkpoint.channel_values["test"] = "test_value"
 
-    except ImportError:
-        # Fall back to Python implementation if Rust is not available
-        pytest.skip("Rust implementation not available")
+    avg_serialization_time = _average_ns("to_json()", to_json=checkpoint.to_json)
+    print(f"Average JSON serialization time: {avg_serialization_time:.2f}ns")
+
+    # Should be significantly faster than Python implementation
+    assert avg_serialization_time < 5000  # Less than 5 microseconds average
 
 
 def test_rust_pregel_executor_performance():
     """Test that demonstrates the performance improvements of Rust Pregel executor."""
-    try:
-        # Import the Rust implementation if available
-        from fast_langgraph.pregel import PregelExecutor
+    # Skip unless the Rust implementation is available
+    PregelExecutor = pytest.importorskip("fast_langgraph.pregel").PregelExecutor
 
-        # Test executor creation performance
-        start_time = time.perf_counter_ns()
-        for i in range(100):
-            executor: PregelExecutor[int, int] = PregelExecutor()
-        end_time = time.perf_counter_ns()
-
-        avg_creation_time = (end_time - start_time) / 100
-        print(f"Average PregelExecutor creation time: {avg_creation_time:.2f}ns")
+    # Test executor creation performance
+    start_time = time.perf_counter_ns()
+    for i in range(100):
+        executor: PregelExecutor[int, int] = PregelExecutor()
+    end_time = time.perf_counter_ns()
 
-        # Should be significantly faster than Python implementation
-        assert avg_creation_time < 5000  # Less than 5 microseconds average
+    avg_creation_time = (end_time - start_time) / 100
+    print(f"Average PregelExecutor creation time: {avg_creation_time:.2f}ns")
 
-    except ImportError:
-        # Fall back to Python implementation if Rust is not available
-        pytest.skip("Rust implementation not available")
+    # Should be significantly faster than Python implementation
+    assert avg_creation_time < 5000  # Less than 5 microseconds average
 
 
 def test_rust_memory_efficiency():
     """Test that demonstrates the memory efficiency of Rust implementation."""
-    try:
-        # Import the Rust implementation if available
-        from fast_langgraph.channels import LastValueChannel
-        from fast_langgraph.checkpoint import Checkpoint
-
-        # Test memory usage of channels
-        channel = LastValueChannel[str]()
-        channel.update(["test_value"])
+    # Skip unless the Rust implementation is available
+    LastValueChannel = pytest.importorskip("fast_langgraph.channels").LastValueChannel
+    Checkpoint = pytest.importorskip("fast_langgraph.checkpoint").Checkpoint
 
-        # Memory usage should be minimal
-        memory_usage = channel.memory_usage()
-        print(f"LastValueChannel memory usage: {memory_usage} bytes")
+    # Test memory usage of channels
+    channel = LastValueChannel[str]()
+    channel.update(["test_value"])
 
-        # Should be significantly less than Python implementation
-        assert memory_usage < 100  # Less than 100 bytes
+    # Memory usage should be minimal
+    memory_usage = channel.memory_usage()
+    print(f"LastValueChannel memory usage: {memory_usage} bytes")
 
-        # Test memory usage of checkpoints
-        checkpoint = Checkpoint()
-        checkpoint.channel_values["test"] = "test_value"
+    # Should be significantly less than Python implementation
+    assert memory_usage < 100  # Less than 100 bytes
 
-        memory_usage = checkpoint.memory_usage()
-        print(f"Checkpoint memory usage: {memory_usage} bytes")
+    # Test memory usage of checkpoints
+    checkpoint = Checkpoint()
+    checkpoint.channel_values["test"] = "test_value"
 
-        # Should be significantly less than Python implementation
-        assert memory_usage < 1000  # Less than 1KB
+    memory_usage = checkpoint.memory_usage()
+    print(f"Checkpoint memory usage: {memory_usage} bytes")
 
-    except ImportError:
-        # Fall back to Python implementation if Rust is not available
-        pytest.skip("Rust implementation not available")
+    # Should be significantly less than Python implementation
+    assert memory_usage < 1000  # Less than 1KB
 
 
 def test_rust_api_compatibility():
     """Test that demonstrates API compatibility with existing Python implementation."""
-    try:
-        # Import the Rust implementation if available
-        from fast_langgraph.channels import Channel, LastValueChannel, TopicChannel
-        from fast_langgraph.checkpoint import Checkpoint
-        from fast_langgraph.pregel import PregelExecutor, PregelNode
-
-        # Test that all expected interfaces are available
-        assert hasattr(LastValueChannel, "update")
-        assert hasattr(LastValueChannel, "get")
-        assert hasattr(LastValueChannel, "is_available")
-
-        # Test that all expected classes can be instantiated
-        channel = LastValueChannel[str]()
-        assert channel is not None
+    # Skip unless the Rust implementation is available
+    channels = pytest.importorskip("fast_langgraph.channels")
+    Checkpoint = pytest.importorskip("fast_langgraph.checkpoint").Checkpoint
+    PregelExecutor = pytest.importorskip("fast_langgraph.pregel").PregelExecutor
+    LastValueChannel, TopicChannel = channels.LastValueChannel, channels.TopicChannel
 
-        topic_channel = TopicChannel[str](True)
-        assert topic_channel is not None
+    # Test that all expected interfaces are available
+    assert hasattr(LastValueChannel, "update")
+    assert hasattr(LastValueChannel, "get")
+    assert hasattr(LastValueChannel, "is_available")
 
-        checkpoint = Checkpoint()
-        assert checkpoint is not None
+    # Test that all expected classes can be instantiated
+    channel = LastValueChannel[str]()
+    assert channel is not None
 
-        executor: PregelExecutor[int, int] = PregelExecutor()
-        assert executor is not None
+    topic_channel = TopicChannel[str](True)
+    assert topic_channel is not None
 
-        # Test basic functionality
-        channel.update(["test"])
-        assert channel.is_available()
-        assert channel.get() == "test"
+    checkpoint = Checkpoint()
+    assert checkpoint is not None
+
+    executor: PregelExecutor[int, int] = PregelExecutor()
+    assert executor is not None
 
-    except ImportError:
-        # Fall back to Python implementation if Rust is not available
-        pytest.skip("Rust implementation not available")
+    # Test basic functionality
+    channel.update(["test"])
+    assert channel.is_available()
+    assert channel.get() == "test"
 
 
 if __name__ == "__main__":
@@ -343,29 +466,39 @@ if __name__ == "__main__":
     try:
         test_rust_channel_performance()
         print("✓ Channel performance test passed")
+    except pytest.skip.Exception as e:
+        print(f"⊘ Channel performance test skipped: {e}")
     except Exception as e:
         print(f"✗ Channel performance test failed: {e}")
 
     try:
         test_rust_checkpoint_performance()
         print("✓ Checkpoint performance test passed")
+    except pytest.skip.Exception as e:
+        print(f"⊘ Checkpoint performance test skipped: {e}")
     except Exception as e:
         print(f"✗ Checkpoint performance test failed: {e}")
 
     try:
         test_rust_pregel_executor_performance()
         print("✓ Pregel executor performance test passed")
+    except pytest.skip.Exception as e:
+        print(f"⊘ Pregel executor performance test skipped: {e}")
     except Exception as e:
         print(f"✗ Pregel executor performance test failed: {e}")
 
     try:
         test_rust_memory_efficiency()
         print("✓ Memory efficiency test passed")
+    except pytest.skip.Exception as e:
+        print(f"⊘ Memory efficiency test skipped: {e}")
     except Exception as e:
         print(f"✗ Memory efficiency test failed: {e}")
 
     try:
         test_rust_api_compatibility()
         print("✓ API compatibility test passed")
+    except pytest.skip.Exception as e:
+        print(f"⊘ API compatibility test skipped: {e}")
     except Exception as e:
         print(f"✗ API compatibility test failed: {e}")
@@ -198,10 +198,11 @@ def test_performance_characteristics():
         print("✓ Testing fast channel operations...")
         channel = fast_langgraph.LastValue(str, "perf_test")
 
-        # Time multiple updates
+        # Time multiple updates (inputs built outside the timed region)
+        updates = [[f"value_{i}"] for i in range(1000)]
         start = time.perf_counter_ns()
-        for i in range(1000):
-            channel.update([f"value_{i}"])
+        for update in updates:
+            channel.update(update)
         end = time.perf_counter_ns()
 
         avg_time = (end - start) / 1000
@@ -3,6 +3,7 @@ Test to verify the package structure and basic functionality
 """
 
 import os
+import subprocess
 import sys
 
 # Add the python directory to the path
@@ -77,6 +78,45 @@ def test_basic_functionality():
         return False
 
 
+def test_import_is_lazy():
+    """Test that importing the package does not load the extension or submodules"""
+    code = (
+        "import sys, fast_langgraph; "
+        "loaded = [m for m in ('fast_langgraph.fast_langgraph', "
+        "'fast_langgraph.shim', 'fast_langgraph.profiler', "
+        "'fast_langgraph.accelerator', 'fast_langgraph._fallback') "
+        "if m in sys.modules]; "
+        "assert not loaded, loaded"
+    )
+    env = {**os.environ, "FAST_LANGGRAPH_AUTO_PATCH": "0"}
+    env.pop("LANGGRAPH_RS_AUTO_PATCH", None)
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env,
+    )
+
+
+def test_auto_patch_is_deferred_until_langgraph_import():
+    """Test that FAST_LANGGRAPH_AUTO_PATCH=1 does not import the shim or LangGraph"""
+    code = (
+        "import sys, fast_langgraph; "
+        "from fast_langgraph.autopatch import PostImportFinder; "
+        "loaded = [m for m in sys.modules "
+        "if m == 'fast_langgraph.shim' or m.split('.')[0] == 'langgraph']; "
+        "assert not loaded, loaded; "
+        "assert any(isinstance(f, PostImportFinder) for f in sys.meta_path)"
+    )
+    env = {**os.environ, "FAST_LANGGRAPH_AUTO_PATCH": "1"}
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        env=env,
+    )
+
+
 if __name__ == "__main__":
     print("Testing LangGraph Rust Package")
     print("=" * 40)
@@ -0,0 +1,64 @@
+"""
+Tests for fast_langgraph._pytest_plugin, run in a nested pytest session
+"""
+
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def fake_langgraph(monkeypatch):
+    """Stand-in langgraph modules providing MemorySaver and InMemoryStore"""
+    modules = {
+        name: types.ModuleType(name)
+        for name in (
+            "langgraph",
+            "langgraph.checkpoint",
+            "langgraph.checkpoint.memory",
+            "langgraph.store",
+            "langgraph.store.memory",
+        )
+    }
+    modules["langgraph.checkpoint.memory"].MemorySaver = type("MemorySaver", (), {})
+    modules["langgraph.store.memory"].InMemoryStore = type("InMemoryStore", (), {})
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+
+def test_plugin_patches_before_collection(pytester, monkeypatch, shim):
+    calls = []
+    monkeypatch.setattr(shim, "patch_langgraph", lambda: calls.append("patched"))
+    pytester.makepyfile("def test_nothing():\n    pass\n")
+
+    result = pytester.runpytest_inprocess("-p", "fast_langgraph._pytest_plugin")
+
+    result.assert_outcomes(passed=1)
+    assert calls == ["patched"]
+
+
+def test_plugin_fixtures_resolve(pytester, monkeypatch, shim, fake_langgraph):
+    monkeypatch.setattr(shim, "patch_langgraph", lambda: False)
+    pytester.makepyfile("""
+        def test_fixtures(event_loop, checkpointer, sync_checkpointer, store):
+            assert not event_loop.is_closed()
+            assert type(checkpointer).__name__ == "MemorySaver"
+            assert type(sync_checkpointer).__name__ == "MemorySaver"
+            assert checkpointer is not sync_checkpointer
+            assert type(store).__name__ == "InMemoryStore"
+        """)
+
+    result = pytester.runpytest_inprocess("-p", "fast_langgraph._pytest_plugin")
+
+    result.assert_outcomes(passed=1)
+
+
+def test_plugin_store_is_none_without_langgraph(pytester, monkeypatch, shim):
+    monkeypatch.setattr(shim, "patch_langgraph", lambda: False)
+    monkeypatch.setitem(sys.modules, "langgraph", None)
+    pytester.makepyfile("def test_store(store):\n    assert store is None\n")
+
+    result = pytester.runpytest_inprocess("-p", "fast_langgraph._pytest_plugin")
+
+    result.assert_outcomes(passed=1)
@@ -2,26 +2,29 @@
 Test to verify the shim functionality for monkeypatching langgraph
 """
 
-import os
 import sys
 
-# Add the python directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "python"))
+import pytest
 
 
-def test_shim_import():
+def test_shim_import(shim):
     """Test that the shim module can be imported"""
-    import fast_langgraph.shim  # noqa: F401
+    assert shim.__name__ == "fast_langgraph.shim"
 
 
-def test_patch_function():
-    """Test that the patch function exists and is callable"""
-    import fast_langgraph.shim
-
-    assert hasattr(fast_langgraph.shim, "patch_langgraph")
-    assert callable(fast_langgraph.shim.patch_langgraph)
-    assert hasattr(fast_langgraph.shim, "unpatch_langgraph")
-    assert callable(fast_langgraph.shim.unpatch_langgraph)
+@pytest.mark.parametrize(
+    "attr",
+    [
+        "patch_langgraph",
+        "unpatch_langgraph",
+        "get_patch_status",
+        "is_func_patched",
+        "print_status",
+    ],
+)
+def test_patch_function(shim, attr):
+    """Test that the shim's public functions exist and are callable"""
+    assert callable(getattr(shim, attr, None))
 
 
 def test_auto_patch_env_var():
@@ -31,9 +34,216 @@ def test_auto_patch_env_var():
     assert hasattr(fast_langgraph, "shim")
 
 
-def test_rust_backend_availability():
-    """Test that the Rust backend classes are available via the package"""
+def test_rust_backend_availability(rust_available):
+    """Test that the Rust backend availability check reports a bool"""
     import fast_langgraph
 
-    assert hasattr(fast_langgraph, "is_rust_available")
-    assert callable(fast_langgraph.is_rust_available)
+    assert isinstance(rust_available, bool)
+    assert fast_langgraph.is_rust_available() is rust_available
+
+
+def test_import_module_prefers_sys_modules(shim):
+    """Test that already-imported modules are resolved without re-importing"""
+    import types
+
+    module = types.ModuleType("_fast_langgraph_test_mod")
+    sys.modules[module.__name__] = module
+    try:
+        assert shim._import_module(module.__name__) is module
+    finally:
+        del sys.modules[module.__name__]
+
+    assert shim._import_module("_fast_langgraph_missing_mod") is None
+
+
+def test_patch_module_functions_batches_one_module(shim):
+    """Test that several functions of one module are patched and restored together"""
+    import types
+
+    module = types.ModuleType("_fast_langgraph_test_algo")
+    module.first = lambda: "first"
+    module.second = lambda: "second"
+    sys.modules[module.__name__] = module
+    try:
+        patched = shim._patch_module_functions(
+            module.__name__,
+            {
+                "first": lambda original: lambda: "fast " + original(),
+                "second": lambda original: lambda: "fast " + original(),
+            },
+        )
+        assert patched == ["first", "second"]
+        assert module.first() == "fast first"
+        assert module.second() == "fast second"
+        assert shim.is_func_patched(module.__name__, "first")
+
+        assert shim.unpatch_langgraph(verbose=False)
+        assert module.first() == "first"
+        assert module.second() == "second"
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_patch_module_functions_is_idempotent(shim):
+    """Test that patching twice does not wrap the accelerated function again"""
+    import types
+
+    module = types.ModuleType("_fast_langgraph_test_idempotent")
+    module.func = lambda: 1
+    original = module.func
+    sys.modules[module.__name__] = module
+    try:
+        factories = {"func": lambda original: lambda: original() + 1}
+        assert shim._patch_module_functions(module.__name__, factories) == ["func"]
+        accelerated = module.func
+        assert accelerated.__fast_langgraph_wrapped__ is True
+
+        assert shim._patch_module_functions(module.__name__, factories) == ["func"]
+        assert module.func is accelerated
+        assert module.func() == 2
+
+        shim.unpatch_langgraph(verbose=False)
+        assert module.func is original
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_post_import_finder_runs_hook_once(tmp_path, monkeypatch):
+    """Test that the auto-patch hook waits for the target module's import"""
+    from fast_langgraph.autopatch import PostImportFinder
+
+    (tmp_path / "_fast_langgraph_test_target.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    seen = []
+    finder = PostImportFinder(["_fast_langgraph_test_target"], seen.append)
+    finder.install()
+    try:
+        assert seen == []
+        import _fast_langgraph_test_target as module
+
+        assert seen == [module]
+        assert module.VALUE == 1
+        assert finder not in sys.meta_path
+    finally:
+        finder.remove()
+        sys.modules.pop("_fast_langgraph_test_target", None)
+
+
+def test_patch_status_is_cached_until_patch_state_changes(shim):
+    """Test that get_patch_status is rebuilt only after patching or unpatching"""
+    import types
+
+    status = shim.get_patch_status()
+    assert shim.get_patch_status() is status
+
+    module = types.ModuleType("_fast_langgraph_test_status")
+    module.func = lambda: 1
+    sys.modules[module.__name__] = module
+    try:
+        shim._patch_module_functions(module.__name__, {"func": lambda f: lambda: 2})
+        patched_status = shim.get_patch_status()
+        assert patched_status is not status
+
+        shim.unpatch_langgraph(verbose=False)
+        assert shim.get_patch_status() is not patched_status
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_patch_plan_follows_langgraph_version(monkeypatch, shim):
+    """Test that the patch plan targets the algo module of the installed release"""
+    if shim._create_accelerated_apply_writes is None:
+        pytest.skip("algo_shims not available")
+
+    def plan_for(version):
+        monkeypatch.setattr(shim, "_langgraph_version", lambda: version)
+        shim._patch_plan.cache_clear()
+        return [module_name for module_name, _ in shim._patch_plan()]
+
+    try:
+        assert plan_for((1, 0, 2)) == ["langgraph.pregel._algo"]
+        assert plan_for((0, 5, 3)) == []
+        assert plan_for(None) == []
+    finally:
+        monkeypatch.undo()
+        shim._patch_plan.cache_clear()
+
+
+def test_unpatch_after_reload_keeps_reloaded_function(tmp_path, monkeypatch, shim):
+    """Test that unpatching does not put a pre-reload original back"""
+    import importlib
+
+    (tmp_path / "_fast_langgraph_test_reload.py").write_text(
+        "def func():\n    return 1\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    import _fast_langgraph_test_reload as module
+
+    try:
+        factories = {"func": lambda original: lambda: original() + 1}
+        shim._patch_module_functions(module.__name__, factories)
+        assert module.func() == 2
+
+        importlib.reload(module)
+        reloaded = module.func
+        assert shim._patch_module_functions(module.__name__, factories) == ["func"]
+        assert module.func() == 2
+
+        shim.unpatch_langgraph(verbose=False)
+        assert module.func is reloaded
+    finally:
+        shim.unpatch_langgraph(verbose=False)
+        sys.modules.pop(module.__name__, None)
+
+
+def test_executor_cache_patch_is_reversible(monkeypatch):
+    """Test that the LangChain executor patch is applied once and can be undone"""
+    import types
+
+    from fast_langgraph import executor_cache
+
+    original = object()
+    package = types.ModuleType("langchain_core")
+    runnables = types.ModuleType("langchain_core.runnables")
+    config = types.ModuleType("langchain_core.runnables.config")
+    config.get_executor_for_config = original
+    runnables.config = config
+    package.runnables = runnables
+    for module in (package, runnables, config):
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    assert executor_cache.patch_langchain_executor()
+    patched = config.get_executor_for_config
+    assert patched is not original
+    assert executor_cache.patch_langchain_executor()
+    assert config.get_executor_for_config is patched
+
+    executor_cache.unpatch_langchain_executor()
+    assert config.get_executor_for_config is original
+
+
+def test_patch_langgraph_returns_early_when_fully_patched(monkeypatch, shim):
+    """Test that a repeated patch_langgraph call does not redo any patching"""
+    import types
+
+    module = types.ModuleType("_fast_langgraph_test_early")
+    module.func = lambda: 1
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    calls = []
+
+    def factory(original):
+        calls.append(original)
+        return lambda: original() + 1
+
+    plan = ((module.__name__, {"func": factory}),)
+    monkeypatch.setattr(shim, "_patch_plan", lambda: plan)
+    monkeypatch.setattr(shim._REG, "executor_cache_patched", True)
+    try:
+        assert shim.patch_langgraph(verbose=False)
+        assert shim.patch_langgraph(verbose=False)
+        assert len(calls) == 1
+        assert module.func() == 2
+    finally:
+        shim.unpatch_langgraph(verbose=False)